@@ -1,4 +1,44 @@
-def BinarySearch(array: list, element: int) -> int:
+import NumericBackend
+
+
+def _goesAfter(value, element, right: bool, reverse: bool) -> bool:
+    """Whether element belongs after value in the sorted order (right=True: also when they are equal)"""
+    if right and value == element:
+        return True
+    return element < value if reverse else value < element
+
+
+def _bound(array, element, low: int, high: int, right: bool, key=None, reverse: bool = False) -> int:
+    """
+    Return the first index in array[low : high] whose value is greater than (right=False: not less than) element.
+    This is where element would be inserted to stay after (right=False: before) any equal values.
+    """
+    while low < high:
+        middle = (low + high) // 2
+        value = array[middle] if key is None else key(array[middle])
+
+        # The element goes after array[middle]
+        if _goesAfter(value, element, right, reverse):
+            low = middle + 1
+        else:
+            high = middle
+
+    return low
+
+
+def _find(array, element, position: int, right: bool, key=None) -> int:
+    """Turn a bound of element into the index of its leftmost (rightmost) occurrence, or -1"""
+    if right:
+        position -= 1
+
+    if 0 <= position < len(array) and (array[position] if key is None else key(array[position])) == element:
+        return position
+    return -1
+
+
+def BinarySearch(
+    array: list, element: int, vectorized: bool = False, mode: str = "any", key=None, reverse: bool = False
+) -> int:
     """
     Binary search works on sorted arrays. Binary search begins by comparing an element in the middle of the array with the target value.
     If the target value matches the element, its position in the array is returned. If the target value is less than the element, the search continues in the lower half of the array.
@@ -11,14 +51,28 @@ def BinarySearch(array: list, element: int) -> int:
 
     Space Complexity: - All Cases:    O(1)      (constant) {Only calculates three values, no matter the array size}
 
-    Note: This implementation doesn't handle duplicate values
+    Note: With duplicate values, `mode="any"` returns the index of any one of them,
+          `mode="left"` the index of the leftmost one and `mode="right"` the index of the rightmost one.
+
+    With `vectorized=True`, a numeric `array.array` or NumPy array is searched by the NumPy backend instead, if NumPy is installed.
+
+    If the array is sorted by a `key` function (in descending order with `reverse=True`), pass the same arguments here.
+    `element` is then a key, and is compared against key(array[middle]), like the `key` argument of `bisect`.
     """
+    if vectorized and key is None and not reverse:
+        index = NumericBackend.searchNumeric(array, element, right=mode == "right")
+        if index is not None:
+            return index
+
+    # Leftmost or rightmost occurrence (or a custom order), narrow down to the boundary instead of stopping at the first match
+    if mode != "any" or key is not None or reverse:
+        right = mode == "right"
+        return _find(array, element, _bound(array, element, 0, len(array), right, key, reverse), right, key)
+
     low, high = 0, len(array)
 
     while low < high:
-        middle = int(
-            low + (high - low) / 2
-        )  # Calculate the middle point every iteration
+        middle = (low + high) // 2  # Calculate the middle point every iteration
 
         if array[middle] == element:
             return middle  # We found the element
@@ -30,3 +84,55 @@ def BinarySearch(array: list, element: int) -> int:
             )  # The element is larger than the current value, set the low boundary to middle
 
     return -1  # The element is not in the array
+
+
+def BinarySearchMany(
+    array: list, queries: list, vectorized: bool = False, mode: str = "left", key=None, reverse: bool = False
+) -> list:
+    """
+    Search for many elements in the same sorted array at once and return their indices (or -1) in the order of the queries.
+    The queries are sorted once and answered in ascending order, so the answer to one query is a lower limit for the next one.
+    Each search gallops forward from the previous answer (1, 2, 4, ... steps) and then binary searches the last step,
+    which costs O(log(d)) for a distance d instead of O(log(n)) from scratch.
+
+    Time Complexity:  - All Cases:    O(m * log(m) + m * log(n / m)) (linear logarithmic) {For m queries}
+
+    Space Complexity: - All Cases:    O(m)      (linear) {The sorted order of the queries and the answers}
+
+    Note: `mode="left"` (also used for "any") returns the index of the leftmost occurrence and `mode="right"` of the rightmost one.
+
+    With `vectorized=True`, numeric input is searched by the NumPy backend in a single `searchsorted` call instead, if NumPy is installed.
+
+    `key` and `reverse` work like in `BinarySearch`, the queries are keys.
+    """
+    right = mode == "right"
+
+    if vectorized and key is None and not reverse:
+        result = NumericBackend.findManyNumeric(array, queries, right)
+        if result is not None:
+            return result
+
+    queries = list(queries)
+    result = [-1] * len(queries)
+    # Answer the queries in the same order as the array
+    order = sorted(range(len(queries)), key=queries.__getitem__, reverse=reverse)
+    length = len(array)
+    position = 0
+
+    for index in order:
+        element = queries[index]
+
+        # Gallop until the bound is somewhere in array[low : high]
+        low, step = position, 1
+        while low + step <= length:
+            value = array[low + step - 1] if key is None else key(array[low + step - 1])
+            if not _goesAfter(value, element, right, reverse):
+                break
+            low += step
+            step *= 2
+        high = min(low + step, length)
+
+        position = _bound(array, element, low, high, right, key, reverse)
+        result[index] = _find(array, element, position, right, key)
+
+    return result
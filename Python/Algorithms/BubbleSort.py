@@ -1,3 +1,7 @@
+import SortOptions
+
+
+@SortOptions.inPlaceSort
 def BubbleSort(array: list):
     """
     Bubble sort, is a simple sorting algorithm that repeatedly steps through the input list element by element, comparing the current element with the one after it, swapping their values if needed.
@@ -10,6 +14,8 @@ def BubbleSort(array: list):
 
 
     Space Complexity: - All Cases:   O(1)   (constant) {In place}
+
+    Takes the `vectorized`, `key` and `reverse` options, and sorts buffers in place (see `SortOptions`).
     """
 
     for i in range(
@@ -0,0 +1,158 @@
+"""
+Sorting support for mutable buffer-protocol sequences: `array.array`, `bytearray`, `mmap.mmap`, shared memory blocks
+and `memoryview`s of any of them.
+
+The sorts work on such inputs through a typed `memoryview` of their buffer, so the elements are read and written in place
+as machine values, and the input is never converted to a list of Python objects. Scratch space (the merge buffer)
+is a buffer of the same type, and reversing or reordering is done with element writes instead of list methods.
+
+Anything that isn't a buffer, like a list, is left to the regular code unchanged, and so are buffers
+whose elements a memoryview can't index (float16, unicode characters, NumPy strings, ...), which are indexed directly.
+"""
+
+import mmap
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# memoryview formats that index as single numbers (or single bytes for 'c') and can be compared
+SORTABLE_FORMATS = set("cbB?hHiIlLqQnNfd")
+
+
+def _checkView(view: memoryview):
+    """Raise if the view can't be sorted in place"""
+    if view.readonly:
+        raise TypeError("cannot sort a read-only buffer in place")
+    if view.ndim != 1:
+        raise ValueError(f"can only sort one-dimensional buffers, got {view.ndim} dimensions")
+
+
+def isBuffer(array) -> bool:
+    """Whether array is a buffer-protocol object (memoryviews included)"""
+    if isinstance(array, (list, tuple, str)):
+        return False
+    # Even the ones that can't be exported as a buffer, like datetimes
+    if numpy is not None and isinstance(array, numpy.ndarray):
+        return True
+    try:
+        memoryview(array).release()
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def typedView(array) -> memoryview:
+    """
+    Returns a writable one-dimensional memoryview of array's buffer, to be used (and released) by the caller.
+    Returns None if array isn't a buffer, already is such a memoryview and can be used as is,
+    or has a format a memoryview can't index (like float16 or unicode characters), in which case array itself,
+    which knows how to read its elements, has to be indexed instead.
+    """
+    # The common case, without the cost of trying to export a buffer
+    if isinstance(array, list):
+        return None
+
+    if isinstance(array, memoryview):
+        _checkView(array)
+        # There is nothing else to index a memoryview through
+        if array.format not in SORTABLE_FORMATS:
+            raise ValueError(f"cannot sort a memoryview of format {array.format!r}")
+        return None
+
+    try:
+        view = memoryview(array)
+    # Not a buffer, or one NumPy can't export (like datetimes)
+    except (TypeError, ValueError):
+        return None
+
+    try:
+        _checkView(view)
+    except (TypeError, ValueError):
+        view.release()
+        raise
+
+    if view.format not in SORTABLE_FORMATS:
+        view.release()
+        return None
+    return view
+
+
+def scratch(view: memoryview) -> memoryview:
+    """A new zeroed buffer with the same format and length as view, instead of a list of n Python objects"""
+    return memoryview(bytearray(view.nbytes)).cast(view.format)
+
+
+def copy(array):
+    """
+    A copy of a buffer of the same type that can be sorted in place: an `array.array`, `bytearray`, NumPy array,
+    anonymous `mmap` or memoryview of a new buffer. Bytes, which can't be sorted in place, are copied to a bytearray.
+    Raises like the in-place sorts if the buffer isn't one-dimensional.
+    """
+    if numpy is not None and isinstance(array, numpy.ndarray):
+        if array.ndim != 1:
+            raise ValueError(f"can only sort one-dimensional buffers, got {array.ndim} dimensions")
+        return array.copy()
+
+    with memoryview(array) as view:
+        if view.ndim != 1:
+            raise ValueError(f"can only sort one-dimensional buffers, got {view.ndim} dimensions")
+
+        if hasattr(array, "typecode"):
+            return array[:]
+        if isinstance(array, (bytes, bytearray)):
+            return bytearray(array)
+        if isinstance(array, mmap.mmap):
+            result = mmap.mmap(-1, len(array))
+            result[:] = view
+            return result
+
+        # There is nothing else to index the copy through
+        if view.format not in SORTABLE_FORMATS:
+            raise ValueError(f"cannot sort a buffer of format {view.format!r}")
+        return memoryview(bytearray(view.tobytes())).cast(view.format)
+
+
+def sortedCopy(array, sort):
+    """Returns a copy of the buffer array of the same type (see `copy`), sorted in place by sort(copy)"""
+    result = copy(array)
+    sort(result)
+    return bytes(result) if isinstance(array, bytes) else result
+
+
+def assign(array, values):
+    """Write the len(array) values of the iterable values into array, element by element if it's a buffer"""
+    if isinstance(array, list):
+        array[:] = values
+        return
+
+    for i, value in enumerate(values):
+        array[i] = value
+
+
+def reverse(array):
+    """Reverse array in place, buffers like memoryview have no reverse method"""
+    if hasattr(array, "reverse"):
+        array.reverse()
+        return
+
+    low, high = 0, len(array) - 1
+    while low < high:
+        array[low], array[high] = array[high], array[low]
+        low += 1
+        high -= 1
+
+
+def permute(array, order):
+    """
+    Reorder array in place, so that array[j] ends up holding the element that was at array[order[j]], order being any iterable.
+    A buffer reads its elements from a copy of the same type, so no list of n Python objects is built.
+    """
+    if isinstance(array, list):
+        array[:] = [array[i] for i in order]
+        return
+
+    source = copy(array)
+    for j, i in enumerate(order):
+        array[j] = source[i]
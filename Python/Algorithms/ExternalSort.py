@@ -0,0 +1,124 @@
+"""
+External (out-of-core) merge sort for files of fixed-width records that don't fit in memory.
+
+    1. The input file is memory-mapped and cut into runs of as many records as fit in the memory limit.
+       Each run is sorted in memory with `MergeSortInPlace` and spilled to a temporary file.
+    2. The runs are k-way merged with a heap, each run being read back through a buffer of a bounded number of records.
+       If there are too many runs for every one of them to get a reasonable buffer, groups of runs are first merged
+       into longer runs, so the memory limit holds whatever the size of the input.
+
+Records are compared as raw bytes, or by the value returned by `key`.
+The result can be streamed record by record with `ExternalMergeSortIter` or written to a file with `ExternalMergeSort`.
+
+Time Complexity: - All Cases:       O(nlog(n)) (linear logarithmic) {Plus O(n) record reads and writes per merge pass}
+
+Space Complexity: - All Cases:      O(M)       (constant) {The memory limit M, plus O(n) disk for the runs}
+"""
+
+import mmap
+import os
+import tempfile
+from heapq import merge
+
+from MergeSort import MergeSortInPlace
+
+# Default memory limit in bytes
+MEMORY_LIMIT = 64 * 1024 * 1024
+# Rough per-record cost of a bytes object and its list slot, on top of the record itself
+RECORD_OVERHEAD = 64
+# A merge never reads a run through a buffer of fewer records than this, it merges fewer runs at a time instead
+MIN_BUFFER_RECORDS = 64
+
+
+def _sortRun(records: list, key) -> list:
+    """Sort one in-memory run"""
+    MergeSortInPlace(records, key=key)
+    return records
+
+
+def _readRun(path: str, recordSize: int, bufferRecords: int):
+    """Lazily yield the records of a run file, reading bufferRecords records at a time"""
+    with open(path, "rb") as run:
+        while True:
+            block = run.read(recordSize * bufferRecords)
+            if not block:
+                return
+
+            for offset in range(0, len(block), recordSize):
+                yield block[offset : offset + recordSize]
+
+
+def _writeRun(directory: str, records) -> str:
+    """Write the records to a new run file in directory and return its path"""
+    descriptor, path = tempfile.mkstemp(dir=directory, suffix=".run")
+    with os.fdopen(descriptor, "wb") as run:
+        for record in records:
+            run.write(record)
+
+    return path
+
+
+def _spillRuns(inputPath: str, recordSize: int, runRecords: int, key, directory: str) -> list:
+    """Cut the input into sorted runs on disk and return their paths"""
+    size = os.path.getsize(inputPath)
+    if size % recordSize:
+        raise ValueError(f"file size {size} is not a multiple of the record size {recordSize}")
+
+    # An empty file can't be mapped
+    if size == 0:
+        return []
+
+    paths = []
+    with open(inputPath, "rb") as source, mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        runBytes = runRecords * recordSize
+
+        for start in range(0, size, runBytes):
+            end = min(start + runBytes, size)
+            records = [mapped[offset : offset + recordSize] for offset in range(start, end, recordSize)]
+            paths.append(_writeRun(directory, _sortRun(records, key)))
+
+    return paths
+
+
+def ExternalMergeSortIter(inputPath: str, recordSize: int, memoryLimit: int = MEMORY_LIMIT, key=None, tempDir: str = None):
+    """
+    Sort the fixed-width records of the file at inputPath using at most about memoryLimit bytes of memory,
+    and lazily yield the sorted records as bytes. Equal records keep their order (the sort is stable).
+    The temporary runs are written to tempDir (the system default if None) and removed when the generator finishes or is closed.
+    """
+    recordCost = recordSize + RECORD_OVERHEAD
+    runRecords = max(1, memoryLimit // recordCost)
+    # Merge at most this many runs at once, so each one still gets a useful buffer
+    fanIn = max(2, memoryLimit // (MIN_BUFFER_RECORDS * recordCost))
+
+    with tempfile.TemporaryDirectory(dir=tempDir) as directory:
+        runs = _spillRuns(inputPath, recordSize, runRecords, key, directory)
+
+        # Too many runs to merge at once, merge them in groups into fewer, longer runs
+        while len(runs) > fanIn:
+            bufferRecords = max(1, runRecords // fanIn)
+            merged = []
+            for start in range(0, len(runs), fanIn):
+                group = runs[start : start + fanIn]
+                readers = [_readRun(path, recordSize, bufferRecords) for path in group]
+                merged.append(_writeRun(directory, merge(*readers, key=key)))
+                for path in group:
+                    os.remove(path)
+            runs = merged
+
+        # The final merge, streamed straight to the caller
+        bufferRecords = max(1, runRecords // max(1, len(runs)))
+        readers = [_readRun(path, recordSize, bufferRecords) for path in runs]
+        yield from merge(*readers, key=key)
+
+
+def ExternalMergeSort(
+    inputPath: str, recordSize: int, outputPath: str, memoryLimit: int = MEMORY_LIMIT, key=None, tempDir: str = None
+):
+    """
+    Sort the fixed-width records of the file at inputPath into the file at outputPath,
+    using at most about memoryLimit bytes of memory. See `ExternalMergeSortIter`.
+    """
+    with open(outputPath, "wb") as output:
+        for record in ExternalMergeSortIter(inputPath, recordSize, memoryLimit, key, tempDir):
+            output.write(record)
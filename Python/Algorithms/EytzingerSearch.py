@@ -0,0 +1,114 @@
+from array import array as Array
+
+# array.array typecodes of the packed value column, for all-int and all-float values
+INTEGER_TYPECODE = "q"
+FLOAT_TYPECODE = "d"
+
+
+class EytzingerIndex:
+    """
+    A static search index over a sorted array, laid out in Eytzinger (breadth-first) order.
+    The sorted values are stored the way a complete binary search tree would be stored in a heap: the root at slot 1,
+    the children of slot k at slots 2k and 2k + 1. A search walks down from slot 1, so the first few levels of every search
+    touch the same few slots at the front of the array, which stay in the cache, and the next slots that can be visited
+    (2k .. 2k + 3 after two steps) sit next to each other in memory instead of being spread over the whole array.
+    The comparison only decides which child to go to, so the loop has no data dependent early exit.
+
+    Integer (or float) values are stored in an `array('q')` (or `array('d')`), any other values in a list.
+    Next to every value, the index it had in the sorted array is kept, so the answers match `BinarySearch`.
+    If the array is sorted by a `key` function, the index stores key(value) instead, computed once per value at build time,
+    and the searches take keys.
+
+    Time Complexity:  - Build:        O(n)      (linear)
+                      - Search:       O(log(n)) (logarithmic)
+
+    Space Complexity: - All Cases:    O(n)      (linear) {Two columns of n + 1 slots}
+    """
+
+    def __init__(self, array: list, key=None):
+        length = len(array)
+        self.length = length
+
+        if key is not None:
+            array = [key(value) for value in array]
+
+        # Pack the values in a typed column if they all fit in one
+        typecode = None
+        if all(type(value) is int for value in array):
+            typecode = INTEGER_TYPECODE
+        elif all(type(value) is float for value in array):
+            typecode = FLOAT_TYPECODE
+
+        # Slot 0 is unused, so the children of slot k are at 2k and 2k + 1
+        values = [0] * (length + 1)
+        positions = Array("q", [0]) * (length + 1)
+
+        # An in-order walk of the implicit tree visits the slots in sorted order, fill them with the sorted values
+        i, slot, stack = 0, 1, []
+        while stack or slot <= length:
+            # Go as far left as possible, remembering the way back
+            while slot <= length:
+                stack.append(slot)
+                slot *= 2
+
+            slot = stack.pop()
+            values[slot] = array[i]
+            positions[slot] = i
+            i += 1
+            slot = 2 * slot + 1
+
+        if typecode is not None:
+            try:
+                values = Array(typecode, values)
+            # Ints too large for a machine word stay in the list
+            except OverflowError:
+                pass
+
+        self.values = values
+        self.positions = positions
+
+    def __len__(self) -> int:
+        return self.length
+
+    def lowerBound(self, element) -> int:
+        """Return the index in the sorted array of the first value that isn't less than element, like `bisect_left`"""
+        values, length = self.values, self.length
+        slot = 1
+
+        # Go right while the value is less than element, left otherwise
+        while slot <= length:
+            slot = 2 * slot + (values[slot] < element)
+
+        # The lower bound is where we last went left, strip the trailing right turns (and that left turn) off the path
+        slot >>= ((~slot) & (slot + 1)).bit_length()
+
+        return self.positions[slot] if slot else length
+
+    def search(self, element) -> int:
+        """
+        Search for element and return its index in the sorted array, or -1.
+        Duplicate values return the index of the leftmost one.
+        """
+        values, length = self.values, self.length
+        slot = 1
+
+        while slot <= length:
+            slot = 2 * slot + (values[slot] < element)
+
+        slot >>= ((~slot) & (slot + 1)).bit_length()
+
+        if slot and values[slot] == element:
+            return self.positions[slot]
+        return -1
+
+
+def EytzingerSearch(index: EytzingerIndex, element) -> int:
+    """
+    Search for element with a prebuilt `EytzingerIndex`, the drop-in replacement for `BinarySearch(array, element)`.
+    Build the index once with `EytzingerIndex(array)` and reuse it for every lookup against the same sorted array.
+
+    Time Complexity:  - All Cases:    O(log(n)) (logarithmic)
+
+    Space Complexity: - All Cases:    O(1)      (constant)
+    """
+    return index.search(element)
@@ -0,0 +1,51 @@
+import SortOptions
+
+
+def _siftDown(array, low: int, root: int, end: int):
+    """Sift array[low + root] down the max heap stored in array[low : low + end]"""
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            return
+
+        # Pick the larger of the two children
+        if child + 1 < end and array[low + child] < array[low + child + 1]:
+            child += 1
+
+        if array[low + root] < array[low + child]:
+            array[low + root], array[low + child] = array[low + child], array[low + root]
+            root = child
+        else:
+            return
+
+
+def _heapSort(array, low: int, high: int):
+    """Heap sort array[low : high] in place"""
+    length = high - low
+
+    # Build a max heap
+    for root in range(length // 2 - 1, -1, -1):
+        _siftDown(array, low, root, length)
+
+    # Repeatedly move the maximum to the end of the unsorted part
+    for end in range(length - 1, 0, -1):
+        array[low], array[low + end] = array[low + end], array[low]
+        _siftDown(array, low, 0, end)
+
+
+@SortOptions.inPlaceSort
+def HeapSort(array: list):
+    """
+    In computer science, heapsort is a comparison-based sorting algorithm which can be thought of as "an implementation of selection sort using the right data structure."
+    Like selection sort, heapsort divides its input into a sorted and an unsorted region, and it iteratively shrinks the unsorted region by extracting the largest element from it and inserting it into the sorted region.
+    Unlike selection sort, heapsort does not waste time with a linear-time scan of the unsorted region; rather, heap sort maintains the unsorted region in a heap data structure to efficiently find the largest element in each step.
+
+    Time Complexity: - Worst Case:      O(nlogn) (linear logarithmic)
+                     - Average Case:    O(nlogn) (linear logarithmic)
+                     - Best Case:       O(nlogn) (linear logarithmic)
+
+    Space Complexity: - All Cases:      O(1)     (constant) {In-place sorting algorithm}
+
+    Takes the `vectorized`, `key` and `reverse` options, and sorts buffers in place (see `SortOptions`).
+    """
+    _heapSort(array, 0, len(array))
@@ -1,20 +1,117 @@
-def InsertionSort(array: list):
+from bisect import bisect_right
+
+import SortOptions
+
+
+def _linearInsertionSort(array, low: int, high: int):
+    """Insert every element by shifting the larger ones of the sorted prefix one place right"""
+    for i in range(low + 1, high):
+        value = array[i]
+        j = i - 1
+
+        # Shift instead of swapping, the value itself is written once at the end
+        while j >= low and array[j] > value:
+            array[j + 1] = array[j]
+            j -= 1
+
+        array[j + 1] = value
+
+
+def _binaryInsertionSort(array, low: int, high: int):
+    """Find every element's place with a binary search, and move the block after it with one slice assignment"""
+    for i in range(low + 1, high):
+        value = array[i]
+        # After any equal values, which keeps the sort stable
+        position = bisect_right(array, value, low, i)
+
+        if position < i:
+            array[position + 1 : i + 1] = array[position:i]
+            array[position] = value
+
+
+def _sentinelInsertionSort(array, low: int, high: int):
+    """Put the minimum first as a sentinel, so the inner loop can't run past it and needs no bounds check"""
+    if high - low < 2:
+        return
+
+    # The first of the smallest values, moved to the front by shifting the ones before it,
+    # so equal values keep their order
+    smallest = min(range(low, high), key=array.__getitem__)
+    value = array[smallest]
+    array[low + 1 : smallest + 1] = array[low:smallest]
+    array[low] = value
+
+    for i in range(low + 2, high):
+        value = array[i]
+        j = i - 1
+
+        # array[low] is not greater than any value, so the loop stops there at the latest
+        while array[j] > value:
+            array[j + 1] = array[j]
+            j -= 1
+
+        array[j + 1] = value
+
+
+INSERTION_MODES = {
+    "linear": _linearInsertionSort,
+    "binary": _binaryInsertionSort,
+    "sentinel": _sentinelInsertionSort,
+}
+
+
+@SortOptions.inPlaceSort
+def _insertionSort(array, low: int, high: int, mode: str):
+    """Sort array[low : high] with the insertion sort of the given mode, the options are handled by the decorator"""
+    INSERTION_MODES[mode](array, low, high)
+
+
+def InsertionSort(
+    array: list,
+    vectorized: bool = False,
+    key=None,
+    reverse: bool = False,
+    low: int = 0,
+    high: int = None,
+    mode: str = "linear",
+):
     """
     Insertion sort is a simple sorting algorithm that builds the final sorted array (or list) one item at a time by comparisons.
     It is much less efficient on large lists than more advanced algorithms such as quicksort, heapsort, or merge sort.
 
     Time Complexity: - Worst Case:    O(n^2) (quadratic)
                      - Average Case:  O(n^2) (quadratic)
-                     - Best Case:     O(n)   (quadratic)
+                     - Best Case:     O(n)   (linear)
 
     Space Complexity: - All Cases:    O(1)   (constant) {In place}
+
+    Only array[low : high] is sorted (the whole array by default),
+    so other sorts can finish subranges without copying them. It has to hold that 0 <= low <= high <= len(array),
+    else a ValueError is raised.
+    `mode` picks how each element finds its place in the sorted part before it:
+        - "linear":   Walk back from the end, shifting larger elements one place right (stable).
+        - "binary":   Binary search for the place and move the block after it with a single slice assignment,
+                      O(nlog(n)) comparisons instead of O(n^2) (stable). Best when comparisons are expensive.
+        - "sentinel": Like "linear", but the minimum is moved to the front first,
+                      which lets the inner loop drop its bounds check (stable).
+
+    Takes the `vectorized`, `key` and `reverse` options, and sorts buffers in place (see `SortOptions`).
     """
+    if high is None:
+        high = len(array)
 
-    for i in range(len(array)):
-        # Divide the array into two parts, sorted (array[ : i]) and unsorted (array[i + 1 : ])
-        j = i - 1
+    # The modes index the array directly, a range outside of it would corrupt it instead of failing
+    if not 0 <= low <= high <= len(array):
+        raise ValueError(f"invalid range [{low}:{high}] for an array of length {len(array)}")
 
-        # Progressively place the last element in the sorted list in the correct place
-        while j >= 0 and array[j] > array[j + 1]:
-            array[j], array[j + 1] = array[j + 1], array[j]
-            j -= 1
+    if mode not in INSERTION_MODES:
+        raise ValueError(f"unknown insertion sort mode {mode!r}")
+
+    # The options work on whole arrays, sort a copy of the range instead
+    if (low, high) != (0, len(array)) and (key is not None or reverse or vectorized):
+        values = array[low:high]
+        _insertionSort(values, vectorized, key, reverse, low=0, high=len(values), mode=mode)
+        array[low:high] = values
+        return
+
+    _insertionSort(array, vectorized, key, reverse, low=low, high=high, mode=mode)
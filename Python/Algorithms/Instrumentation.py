@@ -0,0 +1,226 @@
+"""
+Opt-in operation counting for the algorithms and data structures.
+
+Nothing in the algorithms checks whether instrumentation is on, so it costs nothing unless a `Probe` is in use.
+Instead the probe counts through the data it's handed and through the node classes it's asked to watch:
+    - comparisons: every comparison made with a value wrapped by `probe.value` or `probe.values`.
+    - reads, moves: every element read from and written to a list made by `probe.values`
+      (a swap is two reads and two moves, a slice copy one per element).
+    - links: every node link (next, prev, left, right, parent) followed on the node classes passed as `nodeClasses`,
+      which is the path length of a BST operation or the traversal length of a LinkedList get or remove.
+      While a probe is active, the link attributes of those classes are replaced by counting descriptors, in every thread.
+    - peakBytes, allocatedBytes: the memory allocated while the probe was active, measured with tracemalloc.
+
+    probe = Probe(nodeClasses=[Node], callback=metrics.record)
+    values = probe.values(data)
+    with probe:
+        QuickSortInPlace(values)
+        tree.find(probe.value(key))
+    sortedData = Probe.unwrap(values)
+
+The counts are read from the probe's attributes or `counts()`, and passed to `callback` when the with block ends.
+"""
+
+import tracemalloc
+
+# Node attributes that point to another node
+LINK_ATTRIBUTES = ("next", "prev", "left", "right", "parent")
+
+# (class, attribute) -> the counting descriptor installed there while probes watch it
+_watched = {}
+
+
+def _raw(value):
+    """The value inside a CountingValue, or value itself"""
+    return value.value if isinstance(value, CountingValue) else value
+
+
+class CountingValue:
+    """A value that counts every comparison made with it on its probe"""
+
+    __slots__ = ("value", "probe")
+
+    def __init__(self, value, probe):
+        self.value = value
+        self.probe = probe
+
+    def __lt__(self, other):
+        self.probe.comparisons += 1
+        return self.value < _raw(other)
+
+    def __le__(self, other):
+        self.probe.comparisons += 1
+        return self.value <= _raw(other)
+
+    def __gt__(self, other):
+        self.probe.comparisons += 1
+        return self.value > _raw(other)
+
+    def __ge__(self, other):
+        self.probe.comparisons += 1
+        return self.value >= _raw(other)
+
+    def __eq__(self, other):
+        self.probe.comparisons += 1
+        return self.value == _raw(other)
+
+    def __ne__(self, other):
+        self.probe.comparisons += 1
+        return self.value != _raw(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class CountingList(list):
+    """A list that counts its element reads and writes on its probe"""
+
+    __slots__ = ("probe",)
+
+    def __init__(self, iterable, probe):
+        super().__init__(iterable)
+        self.probe = probe
+
+    def __getitem__(self, index):
+        result = super().__getitem__(index)
+        self.probe.reads += len(result) if isinstance(index, slice) else 1
+        return result
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.probe.moves += len(value)
+        else:
+            self.probe.moves += 1
+        super().__setitem__(index, value)
+
+
+class _CountingLink:
+    """Stands in for a node class's link attribute, counting every read on the active probes"""
+
+    def __init__(self, original):
+        self.original = original
+        self.probes = []
+
+    def __get__(self, node, owner=None):
+        if node is None:
+            return self
+        for probe in self.probes:
+            probe.links += 1
+        return self.original.__get__(node, owner)
+
+    def __set__(self, node, value):
+        self.original.__set__(node, value)
+
+
+class Probe:
+    def __init__(self, nodeClasses=(), callback=None, traceMemory: bool = True):
+        """
+        Instantiate a probe that counts the links followed on nodeClasses (and their subclasses) while it's active,
+        and calls callback(counts) with the counts every time it finishes. Memory isn't traced if traceMemory is False.
+        """
+        self.nodeClasses = tuple(nodeClasses)
+        self.callback = callback
+        self.traceMemory = traceMemory
+        self._startedTracing = False
+        self._baseline = 0
+        self.reset()
+
+    def reset(self):
+        """Set every count back to 0"""
+        self.comparisons = 0
+        self.reads = 0
+        self.moves = 0
+        self.links = 0
+        self.peakBytes = 0
+        self.allocatedBytes = 0
+
+    def counts(self) -> dict:
+        """Returns the counts by name"""
+        return {
+            "comparisons": self.comparisons,
+            "reads": self.reads,
+            "moves": self.moves,
+            "links": self.links,
+            "peakBytes": self.peakBytes,
+            "allocatedBytes": self.allocatedBytes,
+        }
+
+    def value(self, value) -> CountingValue:
+        """Wrap a single value, for example the element passed to a search"""
+        return CountingValue(value, self)
+
+    def values(self, iterable) -> CountingList:
+        """Wrap every value of iterable, in a list that counts its reads and writes"""
+        return CountingList((CountingValue(value, self) for value in iterable), self)
+
+    @staticmethod
+    def unwrap(values) -> list:
+        """Returns a plain list of the values inside wrapped values"""
+        return [_raw(value) for value in values]
+
+    def _links(self) -> set:
+        """
+        The (class, attribute) pairs to watch: every link attribute of nodeClasses, on the class that defines it.
+        Subclasses of the class reach it through the base class, and so does a subclass passed in itself.
+        """
+        links = set()
+        for nodeClass in self.nodeClasses:
+            for name in LINK_ATTRIBUTES:
+                for owner in nodeClass.__mro__:
+                    if name in owner.__dict__:
+                        links.add((owner, name))
+                        break
+        return links
+
+    def _watch(self):
+        for owner, name in self._links():
+            if (owner, name) in _watched:
+                _watched[owner, name].probes.append(self)
+            else:
+                link = _CountingLink(owner.__dict__[name])
+                link.probes.append(self)
+                _watched[owner, name] = link
+                setattr(owner, name, link)
+
+    def _unwatch(self):
+        for owner, name in self._links():
+            link = _watched.get((owner, name))
+            if link is None or self not in link.probes:
+                continue
+
+            link.probes.remove(self)
+            # The last probe watching it puts the original attribute back
+            if not link.probes:
+                setattr(owner, name, link.original)
+                del _watched[owner, name]
+
+    def __enter__(self):
+        self.reset()
+        self._watch()
+
+        if self.traceMemory:
+            self._startedTracing = not tracemalloc.is_tracing()
+            if self._startedTracing:
+                tracemalloc.start()
+            else:
+                tracemalloc.reset_peak()
+            self._baseline = tracemalloc.get_traced_memory()[0]
+
+        return self
+
+    def __exit__(self, *exception):
+        if self.traceMemory:
+            current, peak = tracemalloc.get_traced_memory()
+            self.peakBytes = peak - self._baseline
+            self.allocatedBytes = current - self._baseline
+            if self._startedTracing:
+                tracemalloc.stop()
+
+        self._unwatch()
+
+        if self.callback is not None:
+            self.callback(self.counts())
@@ -1,19 +1,106 @@
+import Buffers
+import SortOptions
+from InsertionSort import InsertionSort
+
+# Runs of this many elements are insertion sorted before the merging starts
+RUN_WIDTH = 16
+
+
 def merge(left: list, right: list) -> list:
     result = []
+    i, j = 0, 0
 
     # progressively merge two sorted arrays into a single sorted array
-    while len(left) and len(right):
-        if left[0] >= right[0]:
-            result.append(right.pop(0))
+    # Walk both arrays by index instead of popping from the front, which is O(n) per pop
+    while i < len(left) and j < len(right):
+        if left[i] > right[j]:
+            result.append(right[j])
+            j += 1
+        else:
+            result.append(left[i])
+            i += 1
+
+    # One of the arrays is exhausted, the rest of the other one is already sorted
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+def _mergeRuns(source, target, low: int, middle: int, high: int):
+    """
+    Merge the sorted runs source[low : middle] and source[middle : high] into target[low : high].
+    Ties are taken from the left run, which keeps the merge stable.
+    """
+    i, j, k = low, middle, low
+
+    while i < middle and j < high:
+        if source[i] > source[j]:
+            target[k] = source[j]
+            j += 1
         else:
-            result.append(left.pop(0))
+            target[k] = source[i]
+            i += 1
+        k += 1
 
-    if len(left) == 0:
-        return result + right
-    return result + left
+    # Copy whatever is left of the unfinished run
+    while i < middle:
+        target[k] = source[i]
+        i += 1
+        k += 1
+    while j < high:
+        target[k] = source[j]
+        j += 1
+        k += 1
 
 
-def MergeSort(array: list) -> list:
+@SortOptions.inPlaceSort
+def MergeSortInPlace(array: list):
+    """
+    Bottom-up merge sort. Sorts `array` in place.
+    Runs of RUN_WIDTH elements are binary insertion sorted first,
+    then runs of width RUN_WIDTH, 2 * RUN_WIDTH, ... are merged pairwise, ping-ponging between `array` and a single scratch buffer
+    that is allocated once, so there is no recursion and no per-level slicing.
+
+    Time Complexity: - Worst Case:		O(nlog(n)) (linear logarithmic)
+                     - Average Case:	O(nlog(n)) (linear logarithmic)
+                     - Best Case:		O(nlog(n)) (linear logarithmic)
+
+    Space Complexity: - All Cases:		O(n)       (linear) {One scratch buffer of n slots}
+
+    Takes the `vectorized`, `key` and `reverse` options, and sorts buffers in place (see `SortOptions`).
+    """
+    length = len(array)
+
+    # A list of 1 or 0 elements is sorted
+    if length <= 1:
+        return
+
+    # Merging tiny runs costs more than insertion sorting them where they are
+    for low in range(0, length, RUN_WIDTH):
+        InsertionSort(array, low=low, high=min(low + RUN_WIDTH, length), mode="binary")
+
+    # The scratch buffer has the same type as the data, so buffers are never boxed into a list
+    source, target = array, Buffers.scratch(array) if isinstance(array, memoryview) else [None] * length
+    width = RUN_WIDTH
+
+    while width < length:
+        # Merge every pair of adjacent runs of size `width`
+        for low in range(0, length, 2 * width):
+            middle = min(low + width, length)
+            high = min(low + 2 * width, length)
+            _mergeRuns(source, target, low, middle, high)
+
+        # The merged runs are now in target, swap the roles of the two buffers
+        source, target = target, source
+        width *= 2
+
+    # The sorted data ended up in the scratch buffer, copy it back
+    if source is not array:
+        array[:] = source
+
+
+@SortOptions.copyingSort(MergeSortInPlace)
+def MergeSort(array: list, workers: int = 1) -> list:
     """
     In computer science, merge sort (also commonly spelled as mergesort) is an efficient, general-purpose, and comparison-based sorting algorithm.
     Most implementations produce a stable sort, which means that the relative order of equal elements is the same in the input and output.
@@ -24,14 +111,29 @@ def MergeSort(array: list) -> list:
                      - Best Case:		O(nlog(n)) (linear logarithmic)
 
     Space Complexity: - All Cases:		O(n)       (linear)
+
+    Note: The input is left untouched, a new sorted list is returned. Use `MergeSortInPlace` to sort the input itself.
+    Takes the `vectorized`, `key` and `reverse` options, and copies buffers into a buffer of the same type (see `SortOptions`).
+
+    With `workers` other than 1, inputs of at least `ParallelSort.PARALLEL_THRESHOLD` elements are sorted by that many
+    processes (all CPUs if None), see `ParallelSort.ParallelMergeSort`.
     """
+    if workers != 1:
+        # Imported here, ParallelSort itself imports this module
+        import ParallelSort
 
-    # Base case. A list of 1 or 0 elements is sorted
-    if len(array) <= 1:
-        return array
+        # The workers sort lists, the result is written into a copy of a buffer so it keeps its type
+        if Buffers.isBuffer(array):
+            return Buffers.sortedCopy(
+                array, lambda values: Buffers.assign(values, ParallelSort.ParallelMergeSort(values, workers))
+            )
 
-    length = len(array)
-    middle = length // 2
+        return ParallelSort.ParallelMergeSort(array, workers)
+
+    # Copy the input once and sort the copy with the bottom-up engine, buffers into a buffer of the same type
+    if Buffers.isBuffer(array):
+        return Buffers.sortedCopy(array, MergeSortInPlace)
 
-    # General case. Break down the array into smaller pieces, merge sort them and finally merge them
-    return merge(MergeSort(array[:middle]), MergeSort(array[middle:]))
+    result = list(array)
+    MergeSortInPlace(result)
+    return result
@@ -0,0 +1,163 @@
+"""
+Optional NumPy backend for the sorting and searching algorithms.
+
+When the input is homogeneous numeric data (a list of ints or floats, an `array.array` or a NumPy array),
+the work can be handed to NumPy's compiled routines instead of running element by element in Python:
+sorting uses NumPy's stable sort (radix sort for small integer types, timsort otherwise) and searching uses `searchsorted`.
+`array.array`, memoryview and ndarray inputs are sorted in place through a zero-copy view of their buffer.
+Lists are sorted through an argsort permutation, so the original objects are put back rather than their NumPy conversions.
+
+If NumPy isn't installed every check fails and the callers fall back to their pure Python code.
+
+A list mixing floats with ints beyond 2^53 is left to the pure Python code too, since float64 would round those ints.
+"""
+
+from array import array as Array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# array.array typecodes that hold numbers NumPy understands, 'u' is a unicode character
+NUMERIC_TYPECODES = set("bBhHiIlLqQfd")
+# Every int up to this size (in absolute value) is exactly representable as a float64
+FLOAT_EXACT_LIMIT = 2**53
+
+
+def asNumericView(array):
+    """
+    Returns an ndarray sharing memory with array if it is an ndarray, `array.array` or memoryview of numbers, else None.
+    No data is copied.
+    """
+    if numpy is None:
+        return None
+
+    if isinstance(array, numpy.ndarray):
+        return array if array.ndim == 1 and array.dtype.kind in "iuf" else None
+
+    if isinstance(array, Array):
+        return numpy.frombuffer(array, dtype=array.typecode) if array.typecode in NUMERIC_TYPECODES else None
+
+    if isinstance(array, memoryview):
+        # frombuffer needs one contiguous block of memory
+        usable = array.ndim == 1 and array.c_contiguous and not array.readonly and array.format in NUMERIC_TYPECODES
+        return numpy.frombuffer(array, dtype=array.format) if usable else None
+
+    return None
+
+
+def asNumeric(array):
+    """
+    Returns an ndarray holding the numbers in array if they are all ints or floats, else None.
+    Buffers are viewed without copying, lists are converted.
+    """
+    if numpy is None:
+        return None
+
+    if isinstance(array, (numpy.ndarray, Array, memoryview)):
+        return asNumericView(array)
+
+    if not isinstance(array, list):
+        return None
+
+    # Booleans would silently turn into numbers
+    if any(type(value) is bool for value in array):
+        return None
+
+    try:
+        converted = numpy.asarray(array)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+    # Strings, objects (ints too large for int64) and nested lists all end up with another kind
+    if converted.ndim != 1 or converted.dtype.kind not in "iuf":
+        return None
+
+    # Ints mixed with floats become float64, which would round the ones beyond 2^53
+    if converted.dtype.kind == "f" and any(type(value) is int and abs(value) > FLOAT_EXACT_LIMIT for value in array):
+        return None
+
+    return converted
+
+
+def sortNumeric(array) -> bool:
+    """
+    Stable sort array in place with NumPy. Returns False (and leaves array untouched) if array isn't numeric.
+    """
+    converted = asNumeric(array)
+    if converted is None:
+        return False
+
+    # Buffers are sorted directly through the shared memory
+    if not isinstance(array, list):
+        converted.sort(kind="stable")
+        return True
+
+    # Put the original objects back in sorted order
+    order = numpy.argsort(converted, kind="stable")
+    array[:] = [array[i] for i in order.tolist()]
+    return True
+
+
+def sortedNumeric(array):
+    """
+    Returns a stable sorted copy of array of the same type, or None if array isn't numeric.
+    """
+    converted = asNumeric(array)
+    if converted is None:
+        return None
+
+    if isinstance(array, list):
+        order = numpy.argsort(converted, kind="stable")
+        return [array[i] for i in order.tolist()]
+
+    result = numpy.sort(converted, kind="stable")
+    if isinstance(array, Array):
+        return Array(array.typecode, result.tobytes())
+    if isinstance(array, memoryview):
+        return memoryview(bytearray(result.tobytes())).cast(array.format)
+    return result
+
+
+def searchNumeric(array, element, right: bool = False) -> int:
+    """
+    Returns the index of the leftmost (right=True: rightmost) occurrence of element in the sorted numeric buffer array, or -1.
+    Returns None if array isn't a numeric buffer, since converting a list would cost more than searching it.
+    """
+    view = asNumericView(array)
+    if view is None:
+        return None
+
+    index = int(numpy.searchsorted(view, element, side="right" if right else "left"))
+    if right:
+        index -= 1
+
+    if 0 <= index < len(view) and view[index] == element:
+        return index
+    return -1
+
+
+def findManyNumeric(array, queries, right: bool = False) -> list:
+    """
+    Returns the indices of the leftmost (right=True: rightmost) occurrences of all the queries in the sorted numeric array,
+    with -1 for the missing ones, or None if either of them isn't numeric.
+    """
+    if numpy is None:
+        return None
+
+    haystack = asNumeric(array)
+    needles = asNumeric(queries if isinstance(queries, (numpy.ndarray, Array, list)) else list(queries))
+    if haystack is None or needles is None:
+        return None
+
+    positions = numpy.searchsorted(haystack, needles, side="right" if right else "left")
+    if right:
+        positions = positions - 1
+
+    # Check every candidate position at once, clipping the ones that fell off either end
+    inBounds = (positions >= 0) & (positions < len(haystack))
+    clipped = numpy.clip(positions, 0, max(len(haystack) - 1, 0))
+    found = inBounds & (haystack[clipped] == needles) if len(haystack) else inBounds
+
+    return numpy.where(found, positions, -1).tolist()
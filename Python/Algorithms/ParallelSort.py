@@ -0,0 +1,156 @@
+"""
+Multi-process versions of merge sort and quicksort.
+
+Both split the input into one chunk per worker, sort the chunks in a `ProcessPoolExecutor` and combine them in the parent:
+    - ParallelMergeSort cuts the input into equal slices and k-way merges the sorted slices with a heap.
+    - ParallelQuickSort partitions the input around splitters taken from a sample (sample sort, the parallel form of
+      quicksort's partitioning step), so the sorted buckets only have to be concatenated.
+
+Ints (that fit in 64 bits) and floats are handed to the workers through one `multiprocessing.shared_memory` block
+holding a typed array, so only the block's name and the chunk boundaries are pickled, not the data.
+Anything else is pickled chunk by chunk.
+
+Inputs smaller than the threshold are sorted serially, since starting the workers costs more than it saves.
+"""
+
+import os
+import random
+from array import array as Array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from multiprocessing.shared_memory import SharedMemory
+
+from MergeSort import MergeSortInPlace
+from QuickSort import QuickSortInPlace
+
+# Inputs smaller than this are sorted serially
+PARALLEL_THRESHOLD = 100_000
+# Sample size per bucket when picking the splitters, more samples give more even buckets
+OVERSAMPLING = 32
+
+
+def _typecode(chunks: list) -> str:
+    """The array.array typecode that can hold every value in the chunks, or None"""
+    if all(type(value) is int for chunk in chunks for value in chunk):
+        values = [value for chunk in chunks if chunk for value in (min(chunk), max(chunk))]
+        if not values or (-(1 << 63) <= min(values) and max(values) < (1 << 63)):
+            return "q"
+    elif all(type(value) is float for chunk in chunks for value in chunk):
+        return "d"
+
+    return None
+
+
+def _sortChunk(arguments: tuple) -> list:
+    """Worker: sort a pickled chunk and send it back"""
+    algorithm, chunk = arguments
+    algorithm(chunk)
+    return chunk
+
+
+def _sortSharedChunk(arguments: tuple):
+    """Worker: sort view[low : high] of the typed array in the shared memory block called name"""
+    algorithm, name, typecode, low, high = arguments
+
+    block = SharedMemory(name=name)
+    view = block.buf.cast(typecode)
+    try:
+        chunk = view[low:high].tolist()
+        algorithm(chunk)
+        view[low:high] = Array(typecode, chunk)
+    finally:
+        view.release()
+        block.close()
+
+
+def _sortChunks(chunks: list, algorithm, workers: int) -> list:
+    """Sort every chunk in its own worker and return the sorted chunks"""
+    typecode = _typecode(chunks)
+
+    # Arbitrary objects have to be pickled
+    if typecode is None:
+        with ProcessPoolExecutor(workers) as pool:
+            return list(pool.map(_sortChunk, [(algorithm, chunk) for chunk in chunks]))
+
+    # Numbers are written once to shared memory, the workers sort their slice of it in place
+    bounds = [0]
+    for chunk in chunks:
+        bounds.append(bounds[-1] + len(chunk))
+
+    block = SharedMemory(create=True, size=max(1, bounds[-1] * Array(typecode).itemsize))
+    view = block.buf.cast(typecode)
+    try:
+        for chunk, low, high in zip(chunks, bounds, bounds[1:]):
+            view[low:high] = Array(typecode, chunk)
+
+        tasks = [(algorithm, block.name, typecode, low, high) for low, high in zip(bounds, bounds[1:])]
+        with ProcessPoolExecutor(workers) as pool:
+            list(pool.map(_sortSharedChunk, tasks))
+
+        return [view[low:high].tolist() for low, high in zip(bounds, bounds[1:])]
+    finally:
+        view.release()
+        block.close()
+        block.unlink()
+
+
+def ParallelMergeSort(array: list, workers: int = None, threshold: int = PARALLEL_THRESHOLD) -> list:
+    """
+    Parallel merge sort. Returns a new sorted list, stable like `MergeSort`.
+    The input is cut into one equal slice per worker (all CPUs if workers is None), the slices are sorted in parallel
+    and k-way merged in the parent with a heap.
+
+    Time Complexity: - All Cases:       O((n / p) * log(n / p) + n * log(p)) (linear logarithmic) {For p workers}
+
+    Space Complexity: - All Cases:      O(n)     (linear)
+    """
+    workers = workers or os.cpu_count() or 1
+    length = len(array)
+
+    if workers <= 1 or length <= 1 or length < threshold:
+        result = list(array)
+        MergeSortInPlace(result)
+        return result
+
+    size = -(-length // workers)
+    chunks = [list(array[low : low + size]) for low in range(0, length, size)]
+
+    # heapq.merge takes equal values from the earlier chunk first, which keeps the sort stable
+    return list(merge(*_sortChunks(chunks, MergeSortInPlace, workers)))
+
+
+def ParallelQuickSort(array: list, workers: int = None, threshold: int = PARALLEL_THRESHOLD) -> list:
+    """
+    Parallel quicksort (sample sort). Returns a new sorted list.
+    workers - 1 splitters are picked from a random sample, the input is partitioned into one bucket per worker
+    (all CPUs if workers is None), and the buckets are sorted in parallel and concatenated.
+
+    Time Complexity: - Average Case:    O(n * log(p) + (n / p) * log(n / p)) (linear logarithmic) {For p workers}
+                     - Worst Case:      O(nlog(n)) (linear logarithmic) {Every value is equal, everything ends up in one bucket}
+
+    Space Complexity: - All Cases:      O(n)     (linear)
+    """
+    workers = workers or os.cpu_count() or 1
+    length = len(array)
+
+    if workers <= 1 or length <= 1 or length < threshold:
+        result = list(array)
+        QuickSortInPlace(result)
+        return result
+
+    # Evenly spaced values of a sorted random sample split the input into roughly equal buckets
+    # Sampling indices instead of the values, so the input isn't copied just to pick a few of them
+    sample = sorted(array[i] for i in random.sample(range(length), min(length, OVERSAMPLING * workers)))
+    step = len(sample) / workers
+    splitters = [sample[int(i * step)] for i in range(1, workers)]
+
+    # The partitioning step, done once for all the buckets
+    buckets = [[] for _ in range(workers)]
+    for value in array:
+        buckets[bisect_right(splitters, value)].append(value)
+
+    result = []
+    for bucket in _sortChunks(buckets, QuickSortInPlace, workers):
+        result.extend(bucket)
+    return result
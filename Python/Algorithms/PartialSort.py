@@ -0,0 +1,117 @@
+"""
+Top-k selection and partial sorting with a bounded heap.
+
+Only the k best elements seen so far are kept, in a heap whose root is the worst of them.
+Every new element is compared with the root once, and only replaces it (one O(log(k)) sift) if it's better,
+so picking the top 100 of 10 million elements costs about one comparison per element instead of a full sort.
+Entries are (key, tiebreak, value) triples, where the tiebreak comes from the element's position,
+so the values are never compared, every key is computed once, and equal keys keep their original order.
+
+Time Complexity: - Worst Case:      O(nlog(k))                (linear logarithmic) {Every element replaces the root}
+                 - Average Case:    O(n + klog(k)log(n / k))  (linear) {Random input}
+                 - Best Case:       O(n + klog(k))            (linear)
+
+Space Complexity: - All Cases:      O(k)                      (linear) {PartialSort also marks the chosen elements in n bytes}
+"""
+
+
+def _worse(a: tuple, b: tuple, largest: bool) -> bool:
+    """Whether entry a is worse than entry b (it would come after b in the result)"""
+    return a < b if largest else b < a
+
+
+def _siftDown(heap: list, root: int, end: int, largest: bool):
+    """Sift heap[root] down heap[:end], which has the worst entry at the root"""
+    entry = heap[root]
+
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            break
+
+        # Pick the worse of the two children
+        if child + 1 < end and _worse(heap[child + 1], heap[child], largest):
+            child += 1
+
+        if not _worse(heap[child], entry, largest):
+            break
+        heap[root] = heap[child]
+        root = child
+
+    heap[root] = entry
+
+
+def _topK(iterable, k: int, key, largest: bool) -> list:
+    """Return the (key, tiebreak, value) entries of the k smallest (largest) elements of iterable, best first"""
+    if k <= 0:
+        return []
+
+    heap = []
+    for i, value in enumerate(iterable):
+        # For the largest elements the larger tiebreak wins, so the earlier one has to get the larger tiebreak
+        entry = (value if key is None else key(value), -i if largest else i, value)
+
+        if len(heap) < k:
+            heap.append(entry)
+            # The heap is full, heapify it bottom-up once
+            if len(heap) == k:
+                for root in range(k // 2 - 1, -1, -1):
+                    _siftDown(heap, root, k, largest)
+        # Better than the worst kept entry, replace it
+        elif _worse(heap[0], entry, largest):
+            heap[0] = entry
+            _siftDown(heap, 0, k, largest)
+
+    # Fewer than k elements, the heap was never built
+    length = len(heap)
+    if length < k:
+        for root in range(length // 2 - 1, -1, -1):
+            _siftDown(heap, root, length, largest)
+
+    # Heap sort the kept entries, moving the worst one to the end every time
+    for end in range(length - 1, 0, -1):
+        heap[0], heap[end] = heap[end], heap[0]
+        _siftDown(heap, 0, end, largest)
+
+    return heap
+
+
+def NSmallest(iterable, k: int, key=None) -> list:
+    """
+    Return a list of the k smallest elements of iterable in ascending order, like sorted(iterable, key=key)[:k].
+    The iterable is read once, so it can be a generator too large to fit in memory.
+    """
+    return [value for _, _, value in _topK(iterable, k, key, False)]
+
+
+def NLargest(iterable, k: int, key=None) -> list:
+    """
+    Return a list of the k largest elements of iterable in descending order, like sorted(iterable, key=key, reverse=True)[:k].
+    The iterable is read once, so it can be a generator too large to fit in memory.
+    """
+    return [value for _, _, value in _topK(iterable, k, key, True)]
+
+
+def PartialSort(array: list, k: int, key=None, reverse: bool = False):
+    """
+    Partially sort array in place: array[:k] ends up holding the k smallest (largest with reverse=True) elements
+    in sorted order, stable, and the other elements follow in their original relative order.
+    """
+    entries = _topK(array, k, key, reverse)
+
+    # Mark the chosen elements, the tiebreak is the element's index, negated for reverse=True
+    chosen = bytearray(len(array))
+    for _, tiebreak, _ in entries:
+        chosen[abs(tiebreak)] = 1
+
+    # Move the other elements to the end in one pass from the back, keeping their order.
+    # The write position never falls behind i, so no element is overwritten before it's moved
+    write = len(array) - 1
+    for i in range(len(array) - 1, -1, -1):
+        if not chosen[i]:
+            array[write] = array[i]
+            write -= 1
+
+    # The chosen values are kept in the entries, so they can go in front now
+    for i, (_, _, value) in enumerate(entries):
+        array[i] = value
@@ -1,31 +1,148 @@
-def QuickSort(array: list) -> list:
+import Buffers
+import SortOptions
+from HeapSort import _heapSort
+from InsertionSort import InsertionSort
+
+# Ranges smaller than this are left for the final insertion sort pass
+INSERTION_CUTOFF = 16
+# Ranges at least this large pick the pivot with Tukey's ninther instead of a plain median of three
+NINTHER_THRESHOLD = 128
+
+
+def _medianOfThree(array, a: int, b: int, c: int) -> int:
+    """Return the index of the median of array[a], array[b] and array[c]"""
+    if array[a] < array[b]:
+        if array[b] < array[c]:
+            return b
+        return c if array[a] < array[c] else a
+    if array[a] < array[c]:
+        return a
+    return c if array[b] < array[c] else b
+
+
+def _choosePivot(array, low: int, high: int) -> int:
+    """Pick a pivot index for array[low : high]"""
+    last = high - 1
+    middle = low + (last - low) // 2
+
+    if high - low < NINTHER_THRESHOLD:
+        return _medianOfThree(array, low, middle, last)
+
+    # Median of the medians of three evenly spaced triples
+    step = (high - low) // 8
+    return _medianOfThree(
+        array,
+        _medianOfThree(array, low, low + step, low + 2 * step),
+        _medianOfThree(array, middle - step, middle, middle + step),
+        _medianOfThree(array, last - 2 * step, last - step, last),
+    )
+
+
+def _partition(array, low: int, high: int) -> int:
+    """
+    Hoare partition of array[low : high] around the chosen pivot.
+    Returns the split point p, array[low : p] <= pivot <= array[p : high] and both sides are non-empty.
+    """
+    # Move the pivot to the front, so the scan is guaranteed to terminate inside the range
+    pivotIndex = _choosePivot(array, low, high)
+    array[low], array[pivotIndex] = array[pivotIndex], array[low]
+    pivot = array[low]
+
+    i, j = low - 1, high
+    while True:
+        i += 1
+        while array[i] < pivot:
+            i += 1
+
+        j -= 1
+        while array[j] > pivot:
+            j -= 1
+
+        if i >= j:
+            return j + 1
+
+        array[i], array[j] = array[j], array[i]
+
+
+def _introSort(array, low: int, high: int, depthLimit: int):
+    while high - low > INSERTION_CUTOFF:
+        # Too many bad pivots, quicksort is going quadratic on this range
+        if depthLimit == 0:
+            _heapSort(array, low, high)
+            return
+        depthLimit -= 1
+
+        split = _partition(array, low, high)
+
+        # Recurse into the smaller side and loop on the larger one, so the stack stays O(log(n))
+        if split - low < high - split:
+            _introSort(array, low, split, depthLimit)
+            low = split
+        else:
+            _introSort(array, split, high, depthLimit)
+            high = split
+
+
+@SortOptions.inPlaceSort
+def QuickSortInPlace(array: list):
+    """
+    Introspective quicksort. Sorts `array` in place.
+    Pivots are picked with a median of three (or ninther on large ranges) and partitioned in place.
+    If the recursion gets deeper than 2 * log(n) the range is heap sorted instead, and ranges smaller than
+    INSERTION_CUTOFF are left alone and finished by a single insertion sort pass at the end.
+
+    Time Complexity: - Worst Case:      O(nlogn) (linear logarithmic)
+                     - Average Case:    O(nlogn) (linear logarithmic)
+                     - Best Case:       O(nlogn) (linear logarithmic)
+
+    Space Complexity: - All Cases:      O(logn)  (logarithmic) {Recursion stack}
+
+    Takes the `vectorized`, `key` and `reverse` options, and sorts buffers in place (see `SortOptions`).
+    """
+    length = len(array)
+
+    _introSort(array, 0, length, 2 * length.bit_length())
+
+    # Every element is now at most INSERTION_CUTOFF places away from its final position
+    InsertionSort(array)
+
+
+@SortOptions.copyingSort(QuickSortInPlace)
+def QuickSort(array: list, workers: int = 1) -> list:
     """
     Quicksort is a divide-and-conquer algorithm.
     It works by selecting a 'pivot' element from the array and partitioning the other elements into two sub-arrays, according to whether they are less than or greater than the pivot.
     For this reason, it is sometimes called partition-exchange sort. The sub-arrays are then sorted recursively.
     This can be done in-place, requiring small additional amounts of memory to perform the sorting.
 
-    Time Complexity: - Worst Case:      O(n^2)   (quadratic)
+    Time Complexity: - Worst Case:      O(nlogn) (linear logarithmic) {Falls back to heap sort}
                      - Average Case:    O(nlogn) (linear logarithmic)
                      - Best Case:       O(nlogn) (linear logarithmic)
 
-    Space Complexity: - All Cases:      O(n)     (linear)
-    """
+    Space Complexity: - All Cases:      O(n)     (linear) {The returned copy}
 
-    # Base Case. Array of 1 or 0 elements is sorted
-    if len(array) <= 1:
-        return array
+    Note: The input is left untouched, a new sorted list is returned. Use `QuickSortInPlace` to sort the input itself.
+    Takes the `vectorized`, `key` and `reverse` options, and copies buffers into a buffer of the same type (see `SortOptions`).
+
+    With `workers` other than 1, inputs of at least `ParallelSort.PARALLEL_THRESHOLD` elements are sorted by that many
+    processes (all CPUs if None), see `ParallelSort.ParallelQuickSort`.
+    """
+    if workers != 1:
+        # Imported here, ParallelSort itself imports this module
+        import ParallelSort
 
-    # Naive implementation of the algorithm. Not implementing the other optimized versions.
-    pivot = array.pop()
+        # The workers sort lists, the result is written into a copy of a buffer so it keeps its type
+        if Buffers.isBuffer(array):
+            return Buffers.sortedCopy(
+                array, lambda values: Buffers.assign(values, ParallelSort.ParallelQuickSort(values, workers))
+            )
 
-    lessThan = [x for x in array if x <= pivot]
-    greaterThan = [x for x in array if x > pivot]
+        return ParallelSort.ParallelQuickSort(array, workers)
 
-    # General Case
-    lessThan = QuickSort(lessThan)
-    greaterThan = QuickSort(greaterThan)
+    # Copy the input once and sort the copy in place, buffers into a buffer of the same type
+    if Buffers.isBuffer(array):
+        return Buffers.sortedCopy(array, QuickSortInPlace)
 
-    lessThan.append(pivot)
-    lessThan.extend(greaterThan)
-    return lessThan
+    result = list(array)
+    QuickSortInPlace(result)
+    return result
@@ -1,3 +1,7 @@
+import SortOptions
+
+
+@SortOptions.inPlaceSort
 def SelectionSort(array: list):
     """
     Selection sort is an in-place comparision sorting algorithm. The algorithm divides the input list into two parts:
@@ -10,6 +14,8 @@ def SelectionSort(array: list):
                      - Best Case:     O(n^2) (quadratic) {Has to compare each element with all the others}
 
     Space Complexity: - All Cases:    O(1)   (constant) {In-place sorting algorithm}
+
+    Takes the `vectorized`, `key` and `reverse` options, and sorts buffers in place (see `SortOptions`).
     """
 
     for i in range(len(array)):  # Go through each index
@@ -0,0 +1,190 @@
+import Buffers
+from InsertionSort import InsertionSort
+from MergeSort import MergeSortInPlace, _mergeRuns
+from QuickSort import QuickSortInPlace
+
+# Arrays up to this size are insertion sorted
+SMALL_ARRAY = 32
+# Natural merge sort is used if the existing runs are at least this long on average
+MIN_AVERAGE_RUN = 32
+# Counting sort is used if the integer keys span at most this many values per element
+COUNTING_RANGE_FACTOR = 2
+# LSD radix sort digit width, and the most passes it may take before a comparison sort is cheaper
+RADIX_BITS = 11
+MAX_RADIX_PASSES = 3
+
+
+def _integerOrder(keys: list) -> list:
+    """
+    If all the keys are ints in a small enough range, return the stable sorted order of their indices, else None.
+    Uses counting sort for dense keys and LSD radix sort for sparse ones.
+    """
+    if not all(type(key) is int for key in keys):
+        return None
+
+    length = len(keys)
+    low = min(keys)
+    span = max(keys) - low + 1
+
+    # Dense keys, count them and place every index directly at its final position
+    if span <= COUNTING_RANGE_FACTOR * length:
+        starts = [0] * (span + 1)
+        for key in keys:
+            starts[key - low + 1] += 1
+        for value in range(span):
+            starts[value + 1] += starts[value]
+
+        order = [0] * length
+        for i, key in enumerate(keys):
+            order[starts[key - low]] = i
+            starts[key - low] += 1
+        return order
+
+    # Sparse keys, distribute the indices by RADIX_BITS bits at a time, least significant digit first
+    bits = (span - 1).bit_length()
+    if bits > RADIX_BITS * MAX_RADIX_PASSES:
+        return None
+
+    mask = (1 << RADIX_BITS) - 1
+    offsets = [key - low for key in keys]
+    order = list(range(length))
+
+    for shift in range(0, bits, RADIX_BITS):
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[(offsets[i] >> shift) & mask].append(i)
+        order = [i for bucket in buckets for i in bucket]
+
+    return order
+
+
+def _findRuns(array: list, limit: int) -> list:
+    """
+    Split array into maximal non-descending runs, reversing strictly descending runs in place.
+    Return the run boundaries [0, ..., len(array)], or None as soon as there are more than limit runs.
+    """
+    length = len(array)
+    boundaries = [0]
+    start = 0
+
+    while start < length:
+        end = start + 1
+
+        # Strictly descending, reversing it can't swap equal elements
+        if end < length and array[end] < array[start]:
+            while end < length and array[end] < array[end - 1]:
+                end += 1
+            array[start:end] = array[start:end][::-1]
+        # Non-descending
+        else:
+            while end < length and not array[end] < array[end - 1]:
+                end += 1
+
+        boundaries.append(end)
+        if len(boundaries) - 1 > limit:
+            return None
+        start = end
+
+    return boundaries
+
+
+def _naturalMergeSort(array: list, boundaries: list):
+    """Merge the sorted runs of array between the boundaries pairwise, ping-ponging with a single scratch buffer"""
+    source, target = array, [None] * len(array)
+
+    while len(boundaries) > 2:
+        merged = [0]
+
+        for i in range(0, len(boundaries) - 1, 2):
+            low, middle = boundaries[i], boundaries[i + 1]
+
+            # Merge the run with the next one
+            if i + 2 < len(boundaries):
+                high = boundaries[i + 2]
+                _mergeRuns(source, target, low, middle, high)
+                merged.append(high)
+            # An odd run out, carry it over to the next round as is
+            else:
+                target[low:middle] = source[low:middle]
+                merged.append(middle)
+
+        source, target = target, source
+        boundaries = merged
+
+    if source is not array:
+        array[:] = source
+
+
+def _sort(array: list):
+    """Stable sort array in place, picking the algorithm from the shape of the data"""
+    length = len(array)
+
+    # Tiny arrays, the simplest algorithm has the lowest overhead
+    if length <= SMALL_ARRAY:
+        InsertionSort(array, mode="binary")
+        return
+
+    # Bounded integers don't need comparisons at all
+    order = _integerOrder(array)
+    if order is not None:
+        array[:] = [array[i] for i in order]
+        return
+
+    # Mostly sorted data, merge the runs that are already there
+    boundaries = _findRuns(array, length // MIN_AVERAGE_RUN)
+    if boundaries is not None:
+        _naturalMergeSort(array, boundaries)
+        return
+
+    # Equal strings can't be told apart, so stability doesn't matter and the in-place quicksort can be used
+    if all(type(value) is str for value in array):
+        QuickSortInPlace(array)
+    else:
+        MergeSortInPlace(array)
+
+
+def Sort(array: list, key=None, reverse: bool = False):
+    """
+    Adaptive sort. Sorts `array` in place, stable, with the same `key` and `reverse` arguments as `list.sort`.
+    Instead of making the caller pick an algorithm, it inspects the input and picks one:
+        - Tiny arrays are binary insertion sorted.
+        - Integer keys in a bounded range are counting sorted (dense) or LSD radix sorted (sparse).
+        - Input made of a few long ascending or descending runs is natural merge sorted.
+        - Anything else goes to the bottom-up merge sort, or the introspective quicksort for strings.
+        - Buffers (`array.array`, `memoryview`, ...) go to the bottom-up merge sort, which sorts them in place.
+    Every key is computed exactly once.
+
+    Time Complexity: - Worst Case:      O(nlog(n)) (linear logarithmic)
+                     - Average Case:    O(nlog(n)) (linear logarithmic)
+                     - Best Case:       O(n)       (linear) {Sorted input, or bounded integers}
+
+    Space Complexity: - All Cases:      O(n)       (linear)
+    """
+    # Buffers are sorted in place by the stable merge sort, through a typed view of their memory
+    if Buffers.isBuffer(array):
+        MergeSortInPlace(array, key=key, reverse=reverse)
+        return
+
+    if len(array) < 2:
+        return
+
+    # Reversing before and after a stable ascending sort gives a stable descending sort
+    if reverse:
+        array.reverse()
+
+    if key is None:
+        _sort(array)
+    else:
+        keys = [key(value) for value in array]
+
+        order = _integerOrder(keys)
+        if order is None:
+            # The index breaks ties, so the values themselves are never compared
+            decorated = list(zip(keys, range(len(keys))))
+            _sort(decorated)
+            order = [i for _, i in decorated]
+
+        array[:] = [array[i] for i in order]
+
+    if reverse:
+        array.reverse()
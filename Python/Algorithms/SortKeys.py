@@ -0,0 +1,61 @@
+"""
+`key` and `reverse` support shared by the sorting algorithms.
+
+Keys are computed exactly once per element (the Schwartzian transform, or decorate-sort-undecorate):
+the algorithm sorts (key, index) pairs, so it only ever compares keys, and the index breaks ties between equal keys,
+which also makes otherwise unstable algorithms stable. The values are then put back in the order of the sorted indices.
+Buffers (see `Buffers`) are reversed and reordered in place, since they have no list methods,
+and copying sorts copy them into a buffer of the same type. Only the keys are held as Python objects, never the values.
+
+A stable descending sort is a stable ascending sort of the reversed input, reversed again,
+so equal elements keep their original order with `reverse=True` too.
+"""
+
+import Buffers
+
+
+def _decorate(values: list, key) -> list:
+    """Pair every key with the index of its value"""
+    # Indexed rather than iterated, since iterating an mmap yields bytes while its elements are ints
+    return [(key(values[i]), i) for i in range(len(values))]
+
+
+def sortWithKey(array: list, sort, key=None, reverse: bool = False):
+    """
+    Sort array in place with the in-place sort function `sort`, ordering the values by key(value), in reverse if asked.
+    """
+    if reverse:
+        Buffers.reverse(array)
+
+    if key is None:
+        sort(array)
+    else:
+        decorated = _decorate(array, key)
+        sort(decorated)
+        Buffers.permute(array, (i for _, i in decorated))
+
+    if reverse:
+        Buffers.reverse(array)
+
+
+def sortedWithKey(array, sort, sortInPlace, key=None, reverse: bool = False) -> list:
+    """
+    Return a new list with the values of array sorted by the copying sort function `sort`,
+    ordering the values by key(value), in reverse if asked.
+    A buffer is copied into a buffer of the same type instead, which is sorted with the in-place sort function `sortInPlace`.
+    """
+    if Buffers.isBuffer(array):
+        return Buffers.sortedCopy(array, lambda values: sortWithKey(values, sortInPlace, key, reverse))
+
+    values = list(array)
+    if reverse:
+        values.reverse()
+
+    if key is None:
+        result = sort(values)
+    else:
+        result = [values[i] for _, i in sort(_decorate(values, key))]
+
+    if reverse:
+        result.reverse()
+    return result
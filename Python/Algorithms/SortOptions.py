@@ -0,0 +1,80 @@
+"""
+The options every sort takes, handled once here instead of in each of the sorts.
+
+    - `key` and `reverse` work like in `list.sort`, every key is computed exactly once (see `SortKeys`).
+    - With `vectorized=True`, numeric input is sorted by the NumPy backend instead, if NumPy is installed.
+      A sort that returns a sorted copy then returns one of the same type as the input.
+    - Buffers (`array.array`, `bytearray`, `mmap`, `memoryview`, ...) are sorted in place through a typed memoryview,
+      without converting them to a list (see `Buffers`). A sort that returns a sorted copy returns a buffer of the same type.
+
+The options are handled in that order by the `inPlaceSort` and `copyingSort` decorators,
+so the algorithm itself only ever sorts a list or a typed memoryview, in ascending order of its elements.
+"""
+
+from functools import wraps
+
+import Buffers
+import NumericBackend
+import SortKeys
+
+
+def inPlaceSort(sort):
+    """
+    Decorate sort(array, **options), which sorts a list or typed memoryview in place, into
+    sort(array, vectorized=False, key=None, reverse=False, **options). The options are passed on as they are.
+    """
+
+    @wraps(sort)
+    def sortWithOptions(array, vectorized: bool = False, key=None, reverse: bool = False, **options):
+        if key is not None or reverse:
+            return SortKeys.sortWithKey(
+                array, lambda values: sortWithOptions(values, vectorized, **options), key, reverse
+            )
+
+        if vectorized and NumericBackend.sortNumeric(array):
+            return
+
+        # Buffers are sorted through a typed view of their memory, never as a list of Python objects
+        view = Buffers.typedView(array)
+        if view is not None:
+            with view:
+                return sort(view, **options)
+
+        return sort(array, **options)
+
+    return sortWithOptions
+
+
+def copyingSort(sortInPlace):
+    """
+    Decorate sort(array, workers), which returns a sorted copy of array, into
+    sort(array, vectorized=False, workers=1, key=None, reverse=False).
+    `sortInPlace` is the in-place version of the sort, it sorts the copy of a buffer when a key or reverse order is asked for,
+    unless workers other than 1 are, then the parallel result is written into the copy.
+    """
+
+    def decorate(sort):
+        @wraps(sort)
+        def sortedWithOptions(array, vectorized: bool = False, workers: int = 1, key=None, reverse: bool = False):
+            def sortCopy(values):
+                """Sort the copy of a buffer in place, by as many workers as asked for"""
+                if workers == 1:
+                    sortInPlace(values, vectorized)
+                else:
+                    Buffers.assign(values, sortedWithOptions(values, vectorized, workers))
+
+            if key is not None or reverse:
+                return SortKeys.sortedWithKey(
+                    array, lambda values: sortedWithOptions(values, vectorized, workers), sortCopy, key, reverse
+                )
+
+            if vectorized:
+                result = NumericBackend.sortedNumeric(array)
+                if result is not None:
+                    return result
+
+            return sort(array, workers)
+
+        return sortedWithOptions
+
+    return decorate
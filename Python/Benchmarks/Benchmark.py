@@ -0,0 +1,456 @@
+"""
+Benchmarks for the algorithms and data structures, compared against the builtins they stand in for.
+
+Every benchmark is run on every input shape (random, sorted, reverse, few unique values, nearly sorted) and size,
+and three separate passes record:
+    - the wall time of the fastest of `--repeat` runs,
+    - the number of comparisons, by running it on values wrapped by an `Instrumentation.Probe`,
+    - the peak memory allocated by the run itself, measured with tracemalloc.
+The passes are kept apart, since counting and tracing slow the run down and would distort the timings.
+Wrapped values aren't ints, so `Sort` takes its comparison sorting path in the counting pass.
+Comparisons made in worker processes or on raw bytes can't be counted, those are recorded as null.
+
+The results are written as JSON, and two result files can be compared to find regressions
+in any of the time, the comparisons or the peak memory:
+
+    python Benchmark.py --sizes 10 1000 100000 --output new.json
+    python Benchmark.py --compare old.json new.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from bisect import bisect_left
+from itertools import islice
+
+# The modules live in directories next to this one, which aren't packages
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "Algorithms"), os.path.join(ROOT, "Data Structures")]
+
+from AVLTree import AVLNode, AVLTree  # noqa: E402
+from BinarySearch import BinarySearch, BinarySearchMany  # noqa: E402
+from BinarySearchTree import BST, Node  # noqa: E402
+from BubbleSort import BubbleSort  # noqa: E402
+from ExternalSort import ExternalMergeSort  # noqa: E402
+from EytzingerSearch import EytzingerIndex, EytzingerSearch  # noqa: E402
+from HeapSort import HeapSort  # noqa: E402
+from InsertionSort import InsertionSort  # noqa: E402
+from Instrumentation import Probe  # noqa: E402
+from LinkedList import LinkedList  # noqa: E402
+from MergeSort import MergeSort, MergeSortInPlace  # noqa: E402
+from ParallelSort import ParallelMergeSort, ParallelQuickSort  # noqa: E402
+from PartialSort import NLargest, NSmallest, PartialSort  # noqa: E402
+from QuickSort import QuickSort, QuickSortInPlace  # noqa: E402
+from RedBlackTree import RBNode, RedBlackTree  # noqa: E402
+from SelectionSort import SelectionSort  # noqa: E402
+from Sort import Sort  # noqa: E402
+
+# 10 to 10^7 elements
+DEFAULT_SIZES = [10**exponent for exponent in range(1, 8)]
+# Quadratic algorithms, and the unbalanced BST which is quadratic on sorted input, stop at this size
+QUADRATIC_LIMIT = 10**4
+# Searches and single element operations are timed over this many random queries
+QUERIES = 1000
+# Top-k benchmarks select this many elements
+TOP_K = 100
+# Range queries stop after this many values
+RANGE_LENGTH = 100
+# Metrics compared between two result files, a result is worse when its metric grew
+METRICS = ("seconds", "comparisons", "peakBytes")
+# Seed of the inputs and the queries, so every run sees the same data
+SEED = 0
+
+
+def randomShape(size: int, rng: random.Random) -> list:
+    values = list(range(size))
+    rng.shuffle(values)
+    return values
+
+
+def sortedShape(size: int, rng: random.Random) -> list:
+    return list(range(size))
+
+
+def reverseShape(size: int, rng: random.Random) -> list:
+    return list(range(size - 1, -1, -1))
+
+
+def fewUniqueShape(size: int, rng: random.Random) -> list:
+    return [rng.randrange(10) for _ in range(size)]
+
+
+def nearlySortedShape(size: int, rng: random.Random) -> list:
+    """Sorted, with 1% of the elements swapped with a random other one"""
+    values = list(range(size))
+    for _ in range(max(1, size // 100)):
+        i, j = rng.randrange(size), rng.randrange(size)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+SHAPES = {
+    "random": randomShape,
+    "sorted": sortedShape,
+    "reverse": reverseShape,
+    "fewUnique": fewUniqueShape,
+    "nearlySorted": nearlySortedShape,
+}
+
+
+class Benchmark:
+    def __init__(self, name: str, setup, run, maxSize: int = None, counted: bool = True, teardown=None):
+        """
+        setup(values) prepares the argument of run(argument) outside of the measurement,
+        and teardown(argument) cleans up after it.
+        Sizes above maxSize are skipped, and comparisons aren't counted unless counted is True.
+        """
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.maxSize = maxSize
+        self.counted = counted
+        self.teardown = teardown
+
+    def measure(self, values: list) -> float:
+        """Run the benchmark once on values and return the wall time in seconds"""
+        argument = self.setup(values)
+        try:
+            start = time.perf_counter()
+            self.run(argument)
+            return time.perf_counter() - start
+        finally:
+            if self.teardown:
+                self.teardown(argument)
+
+    def countComparisons(self, values: list) -> int:
+        """Run the benchmark once on counting values and return the number of comparisons"""
+        if not self.counted:
+            return None
+
+        probe = Probe(traceMemory=False)
+        argument = self.setup([probe.value(value) for value in values])
+        try:
+            with probe:
+                self.run(argument)
+            return probe.comparisons
+        finally:
+            if self.teardown:
+                self.teardown(argument)
+
+    def peakMemory(self, values: list) -> int:
+        """Run the benchmark once on values and return the peak memory it allocated, in bytes"""
+        argument = self.setup(values)
+        try:
+            tracemalloc.start()
+            self.run(argument)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            if self.teardown:
+                self.teardown(argument)
+
+
+def _queries(values: list) -> list:
+    """QUERIES random values to search for"""
+    return random.Random(SEED).choices(values, k=QUERIES) if values else []
+
+
+def _sortedWithQueries(values: list) -> tuple:
+    return sorted(values), _queries(values)
+
+
+def _inPlace(sort) -> Benchmark:
+    quadratic = sort in (BubbleSort, InsertionSort, SelectionSort)
+    return Benchmark(sort.__name__, list, sort, QUADRATIC_LIMIT if quadratic else None)
+
+
+def _writeRecords(values: list) -> tuple:
+    """Write values as 8-byte records to a temporary file, return the input and output paths"""
+    descriptor, inputPath = tempfile.mkstemp(suffix=".records")
+    with os.fdopen(descriptor, "wb") as records:
+        for value in values:
+            records.write(value.to_bytes(8, "big"))
+    return inputPath, inputPath + ".sorted"
+
+
+def _removeRecords(paths: tuple):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _buildList(values: list) -> tuple:
+    return LinkedList.fromIterable(values), [random.Random(SEED).randrange(len(values)) for _ in range(QUERIES)]
+
+
+def _insertTailAll(values: list):
+    linkedList = LinkedList()
+    for value in values:
+        linkedList.insertTail(value)
+
+
+def _insertHeadAll(values: list):
+    linkedList = LinkedList()
+    for value in values:
+        linkedList.insertHead(value)
+
+
+def _insertBetweenMany(argument: tuple):
+    linkedList, indices = argument
+    for index in indices:
+        if len(linkedList):
+            linkedList.insertBetween(index % len(linkedList), index)
+
+
+def _removeMany(argument: tuple):
+    linkedList, indices = argument
+    for index in indices:
+        if len(linkedList):
+            linkedList.remove(index % len(linkedList))
+
+
+def _treeBenchmarks(treeClass, nodeClass, maxSize: int) -> list:
+    name = treeClass.__name__
+
+    def insertAll(values: list):
+        tree = treeClass()
+        for value in values:
+            tree.insert(nodeClass(value))
+
+    def build(values: list) -> tuple:
+        tree = treeClass()
+        for value in values:
+            tree.insert(nodeClass(value))
+        return tree, _queries(values)
+
+    def findMany(argument: tuple):
+        tree, queries = argument
+        for query in queries:
+            tree.find(query)
+
+    def deleteMany(argument: tuple):
+        tree, queries = argument
+        for query in queries:
+            tree.deleteKey(query)
+
+    def buildWithNodes(values: list) -> tuple:
+        tree, queries = build(values)
+        return tree, [tree.find(query) for query in queries]
+
+    def buildWithIndices(values: list) -> tuple:
+        tree, _ = build(values)
+        return tree, [random.Random(SEED).randrange(len(values)) for _ in range(QUERIES)] if values else []
+
+    def rangeMany(argument: tuple):
+        tree, queries = argument
+        if tree.root is None:
+            return
+        high = tree.maximum(tree.root).key
+        for query in queries:
+            for _ in islice(tree.range(query, high), RANGE_LENGTH):
+                pass
+
+    def balanced(values: list):
+        return treeClass.fromSorted(sorted(values))
+
+    return [
+        Benchmark(f"{name}.insert", list, insertAll, maxSize),
+        Benchmark(f"{name}.find", build, findMany, maxSize),
+        Benchmark(f"{name}.deleteKey", build, deleteMany, maxSize),
+        Benchmark(
+            f"{name}.successor",
+            buildWithNodes,
+            lambda argument: [argument[0].successor(node) for node in argument[1]],
+            maxSize,
+        ),
+        Benchmark(
+            f"{name}.predecessor",
+            buildWithNodes,
+            lambda argument: [argument[0].predecessor(node) for node in argument[1]],
+            maxSize,
+        ),
+        Benchmark(f"{name}.range", build, rangeMany, maxSize),
+        Benchmark(f"{name}.rank", build, lambda argument: [argument[0].rank(query) for query in argument[1]], maxSize),
+        Benchmark(
+            f"{name}.select",
+            buildWithIndices,
+            lambda argument: [argument[0].select(k) for k in argument[1]],
+            maxSize,
+        ),
+        Benchmark(
+            f"{name}.height",
+            buildWithNodes,
+            lambda argument: [argument[0].height(node) for node in argument[1]],
+            maxSize,
+        ),
+        Benchmark(
+            f"{name}.depth",
+            buildWithNodes,
+            lambda argument: [argument[0].depth(node) for node in argument[1]],
+            maxSize,
+        ),
+        Benchmark(f"{name}.fromSorted", sorted, treeClass.fromSorted),
+        Benchmark(f"{name}.inOrderTraversal", balanced, lambda tree: tree.inOrderTraversal(tree.root)),
+        Benchmark(f"{name}.preOrderTraversal", balanced, lambda tree: tree.preOrderTraversal(tree.root)),
+        Benchmark(f"{name}.postOrderTraversal", balanced, lambda tree: tree.postOrderTraversal(tree.root)),
+    ]
+
+
+BENCHMARKS = [
+    # In-place sorts
+    *map(_inPlace, [BubbleSort, InsertionSort, SelectionSort, MergeSortInPlace, QuickSortInPlace, HeapSort, Sort]),
+    Benchmark("builtin list.sort", list, list.sort),
+    # Copying sorts
+    Benchmark("MergeSort", list, MergeSort),
+    Benchmark("QuickSort", list, QuickSort),
+    Benchmark("ParallelMergeSort", list, ParallelMergeSort, counted=False),
+    Benchmark("ParallelQuickSort", list, ParallelQuickSort, counted=False),
+    Benchmark(
+        "ExternalMergeSort",
+        _writeRecords,
+        lambda paths: ExternalMergeSort(paths[0], 8, paths[1]),
+        counted=False,
+        teardown=_removeRecords,
+    ),
+    Benchmark("builtin sorted", list, sorted),
+    # Top-k
+    Benchmark("NSmallest", list, lambda values: NSmallest(values, TOP_K)),
+    Benchmark("NLargest", list, lambda values: NLargest(values, TOP_K)),
+    Benchmark("PartialSort", list, lambda values: PartialSort(values, TOP_K)),
+    Benchmark("builtin sorted[:k]", list, lambda values: sorted(values)[:TOP_K]),
+    # Searches, QUERIES lookups in a sorted array
+    Benchmark(
+        "BinarySearch",
+        _sortedWithQueries,
+        lambda argument: [BinarySearch(argument[0], query) for query in argument[1]],
+    ),
+    Benchmark("BinarySearchMany", _sortedWithQueries, lambda argument: BinarySearchMany(*argument)),
+    Benchmark(
+        "EytzingerSearch",
+        lambda values: (EytzingerIndex(sorted(values)), _queries(values)),
+        lambda argument: [EytzingerSearch(argument[0], query) for query in argument[1]],
+    ),
+    Benchmark("EytzingerIndex build", sorted, EytzingerIndex),
+    Benchmark(
+        "builtin bisect_left",
+        _sortedWithQueries,
+        lambda argument: [bisect_left(argument[0], query) for query in argument[1]],
+    ),
+    # Linked list, the indexed operations are QUERIES random indices
+    Benchmark("LinkedList.insertTail", list, _insertTailAll),
+    Benchmark("LinkedList.insertHead", list, _insertHeadAll),
+    Benchmark("LinkedList.extend", list, LinkedList.fromIterable),
+    Benchmark("LinkedList.insertBetween", _buildList, _insertBetweenMany, QUADRATIC_LIMIT),
+    Benchmark("LinkedList.get", _buildList, lambda argument: [argument[0].get(index) for index in argument[1]]),
+    Benchmark("LinkedList.remove", _buildList, _removeMany),
+    Benchmark("LinkedList.getValues", LinkedList.fromIterable, LinkedList.getValues),
+    # Trees, the lookups and node operations are QUERIES random values, nodes or ranks
+    *_treeBenchmarks(BST, Node, QUADRATIC_LIMIT),
+    *_treeBenchmarks(AVLTree, AVLNode, None),
+    *_treeBenchmarks(RedBlackTree, RBNode, None),
+]
+
+
+def runBenchmarks(sizes: list, shapes: list, names: list = None, repeat: int = 3, log=None) -> list:
+    """
+    Run the benchmarks whose names contain one of names (all if None) on every shape and size,
+    and return a list of result records.
+    """
+    results = []
+
+    for benchmark in BENCHMARKS:
+        if names and not any(name in benchmark.name for name in names):
+            continue
+
+        for shape in shapes:
+            for size in sizes:
+                if benchmark.maxSize is not None and size > benchmark.maxSize:
+                    continue
+
+                values = SHAPES[shape](size, random.Random(SEED))
+                result = {
+                    "benchmark": benchmark.name,
+                    "shape": shape,
+                    "size": size,
+                    "seconds": min(benchmark.measure(values) for _ in range(repeat)),
+                    "comparisons": benchmark.countComparisons(values),
+                    "peakBytes": benchmark.peakMemory(values),
+                }
+                results.append(result)
+
+                if log:
+                    log(f"{benchmark.name:32} {shape:12} {size:>10} {result['seconds']:12.6f}s")
+
+    return results
+
+
+def compareResults(old: dict, new: dict, threshold: float = 1.1) -> list:
+    """
+    Return (benchmark, shape, size, metric, old value, new value) for every metric of METRICS of every result
+    that grew to more than threshold times its old value. Metrics that weren't recorded (null) are skipped.
+    """
+    before = {(result["benchmark"], result["shape"], result["size"]): result for result in old["results"]}
+    regressions = []
+
+    for result in new["results"]:
+        previous = before.get((result["benchmark"], result["shape"], result["size"]))
+        if previous is None:
+            continue
+
+        for metric in METRICS:
+            oldValue, newValue = previous.get(metric), result.get(metric)
+            if oldValue is not None and newValue is not None and newValue > threshold * oldValue:
+                regressions.append((result["benchmark"], result["shape"], result["size"], metric, oldValue, newValue))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="input sizes (default: 10 to 10^7)")
+    parser.add_argument(
+        "--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES), help="input shapes (default: all)"
+    )
+    parser.add_argument("--benchmarks", nargs="+", help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement, the fastest one is kept")
+    parser.add_argument("--output", default="benchmark.json", help="where to write the results")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files instead of running"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=1.1, help="growth ratio of a metric reported as a regression"
+    )
+    arguments = parser.parse_args()
+
+    if arguments.compare:
+        with open(arguments.compare[0]) as old, open(arguments.compare[1]) as new:
+            regressions = compareResults(json.load(old), json.load(new), arguments.threshold)
+
+        for name, shape, size, metric, before, after in regressions:
+            ratio = f"{after / before:.2f}x" if before else "new"
+            print(f"{name:32} {shape:12} {size:>10} {metric:12} {before:>14g} -> {after:>14g} ({ratio})")
+        sys.exit(1 if regressions else 0)
+
+    results = runBenchmarks(arguments.sizes, arguments.shapes, arguments.benchmarks, arguments.repeat, print)
+
+    with open(arguments.output, "w") as output:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "results": results,
+            },
+            output,
+            indent=2,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+    In computer science, an AVL tree (named after inventors Adelson-Velsky and Landis) is a self-balancing binary search tree.
+    In an AVL tree, the heights of the two child subtrees of any node differ by at most one;
+    if at any time they differ by more than one, rebalancing is done to restore this property.
+    Each node stores the height of its subtree, so the balance factor of a node is available in constant time
+    and only the nodes on the path from a modified node to the root have to be looked at after an insertion or deletion.
+
+    Time Complexity: - All Cases:
+                         - Search: O(log(n)) (logarithmic)
+                         - Insert: O(log(n)) (logarithmic)
+                         - Delete: O(log(n)) (logarithmic)
+                         - Rank:   O(log(n)) (logarithmic) {Also select and countRange}
+                         - Height: O(1)      (constant)
+
+    Space Complexity: - All Cases: O(n)      (linear)
+"""
+
+from BinarySearchTree import BST, Node
+
+
+class AVLNode(Node):
+    # The height is kept on every Node
+    __slots__ = ()
+
+
+class AVLTree(BST):
+    nodeClass = AVLNode
+
+    def _balance(self, node: AVLNode) -> int:
+        """Height of the left subtree minus the height of the right subtree"""
+        return self.height(node.left) - self.height(node.right)
+
+    def _retrace(self, node: AVLNode):
+        """Walk up from node to the root, fixing heights and rotating wherever a subtree became unbalanced"""
+        while node is not None:
+            self._updateNode(node)
+            balance = self._balance(node)
+
+            # Left heavy
+            if balance > 1:
+                # Left-Right case, turn it into a Left-Left case first
+                if self._balance(node.left) < 0:
+                    self._rotateLeft(node.left)
+                node = self._rotateRight(node)
+            # Right heavy
+            elif balance < -1:
+                # Right-Left case, turn it into a Right-Right case first
+                if self._balance(node.right) > 0:
+                    self._rotateRight(node.right)
+                node = self._rotateLeft(node)
+
+            node = node.parent
+
+    def insert(self, node: AVLNode) -> AVLNode:
+        """
+        Inserts a node in the tree with the value `value` and return the inserted node.
+        """
+        super().insert(node)
+        self._retrace(node.parent)
+
+        return node
+
+    def _deleteNode(self, currentNode: AVLNode) -> AVLNode:
+        lowest = super()._deleteNode(currentNode)
+        self._retrace(lowest)
+
+        return lowest
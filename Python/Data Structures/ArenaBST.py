@@ -0,0 +1,318 @@
+"""
+    An arena backed binary search tree. Instead of one Python object per node, the nodes live in parallel columns:
+    a list holding the values and three `array('q')` columns holding the index of the left child, right child and parent,
+    with -1 standing in for None. A node is just an index into those columns, so each element costs one list slot and
+    three machine integers, there are no node objects for the garbage collector to track, and removed slots are reused
+    through a free list.
+
+    The operations mirror `BST`, except that nodes are referred to by index and new nodes are created from values.
+
+    Time Complexity: - Worst Case {Degenerate Tree}:
+                         - Search: O(n)      (linear)
+                         - Insert: O(n)      (linear)
+                         - Delete: O(n)      (linear)
+
+                     - Average Case {Non-Degenerate Tree}:
+                         - Search: O(log(n)) (logarithmic)
+                         - Insert: O(log(n)) (logarithmic)
+                         - Delete: O(log(n)) (logarithmic)
+
+    Space Complexity: - All Cases: O(n)      (linear)
+"""
+
+from array import array
+
+# Index used in place of a missing node
+NIL = -1
+
+
+class ArenaBST:
+    def __init__(self):
+        self.root = NIL
+        self.values = []
+        self.left = array("q")
+        self.right = array("q")
+        self.parent = array("q")
+        # Chain of released slots, linked through the `right` column
+        self.free = NIL
+
+    def _allocate(self, value) -> int:
+        """Returns the index of a fresh node holding value, reusing a released slot if there is one"""
+        if self.free != NIL:
+            index = self.free
+            self.free = self.right[index]
+            self.values[index] = value
+            self.left[index] = self.right[index] = self.parent[index] = NIL
+        else:
+            index = len(self.values)
+            self.values.append(value)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.parent.append(NIL)
+
+        return index
+
+    def _release(self, index: int):
+        """Puts the slot at index on the free list"""
+        # Drop the reference so the value can be collected
+        self.values[index] = None
+        self.left[index] = self.parent[index] = NIL
+        self.right[index] = self.free
+        self.free = index
+
+    def depth(self, value) -> int:
+        """
+        The depth of a node is the number of edges present in path from the root node of a tree to that node
+        """
+        currentNode = self.root
+        currentDepth = 0
+
+        while currentNode != NIL:
+            currentValue = self.values[currentNode]
+            # Found the node
+            if value == currentValue:
+                return currentDepth
+            # Go left
+            elif value <= currentValue:
+                currentNode = self.left[currentNode]
+            # Go right
+            else:
+                currentNode = self.right[currentNode]
+            # The node is further down
+            currentDepth += 1
+
+        # Node doesn't exist
+        return -1
+
+    def height(self, node: int) -> int:
+        """
+        The height of a node in a binary tree is the largest number of edges in a path from a leaf node to a target node.
+        """
+        height = -1
+        level = [node] if node != NIL else []
+
+        # Walk the subtree level by level, one level per edge
+        while level:
+            height += 1
+            nextLevel = []
+            for currentNode in level:
+                if self.left[currentNode] != NIL:
+                    nextLevel.append(self.left[currentNode])
+                if self.right[currentNode] != NIL:
+                    nextLevel.append(self.right[currentNode])
+            level = nextLevel
+
+        return height
+
+    def search(self, value) -> int:
+        """
+        Search for a node with the value `value` and return its index, or -1.
+        """
+        currentNode = self.root
+
+        # Search until we reach a leaf node
+        while currentNode != NIL:
+            currentValue = self.values[currentNode]
+            # Found the node
+            if value == currentValue:
+                return currentNode
+            # Node is in the left subtree
+            elif value <= currentValue:
+                currentNode = self.left[currentNode]
+            # Node is in the right subtree
+            else:
+                currentNode = self.right[currentNode]
+
+        # Node not found
+        return NIL
+
+    def maximum(self, node: int) -> int:
+        """Find the right most node in the node's right subtree"""
+
+        while self.right[node] != NIL:
+            node = self.right[node]
+
+        return node
+
+    def minimum(self, node: int) -> int:
+        """Find the left most node in the node's left subtree"""
+
+        while self.left[node] != NIL:
+            node = self.left[node]
+
+        return node
+
+    def successor(self, node: int) -> int:
+        """
+        Successor of a node is the node with the smallest key that is greater than the key of the given node.
+        """
+        # Return the leftmost node in the node's right subtree if it exists
+        if self.right[node] != NIL:
+            return self.minimum(self.right[node])
+
+        # Go up until we are not the right child
+        successor = self.parent[node]
+        while successor != NIL and node == self.right[successor]:
+            node = successor
+            successor = self.parent[node]
+
+        return successor
+
+    def predecessor(self, node: int) -> int:
+        """
+        Predecessor of a node is the node with the largest key that is smaller than the key of the given node.
+        """
+        # Return the rightmost node in the node's left subtree if it exists
+        if self.left[node] != NIL:
+            return self.maximum(self.left[node])
+
+        # Go up until we are not the left child
+        predecessor = self.parent[node]
+        while predecessor != NIL and node == self.left[predecessor]:
+            node = predecessor
+            predecessor = self.parent[node]
+
+        return predecessor
+
+    def insert(self, value) -> int:
+        """
+        Inserts a node in the tree with the value `value` and return the index of the inserted node.
+        """
+        node = self._allocate(value)
+
+        # The tree is empty, insert a root node with `value`
+        if self.root == NIL:
+            self.root = node
+            return node
+
+        currentNode = self.root
+        while True:
+            # Go left
+            if value <= self.values[currentNode]:
+                if self.left[currentNode] == NIL:
+                    self.left[currentNode] = node
+                    break
+                currentNode = self.left[currentNode]
+            # Go right
+            else:
+                if self.right[currentNode] == NIL:
+                    self.right[currentNode] = node
+                    break
+                currentNode = self.right[currentNode]
+
+        self.parent[node] = currentNode
+        return node
+
+    def _shiftNodes(self, replace: int, replaceWith: int):
+        """
+        Helper function for deleting nodes.
+        Only shifts the replaceWith to replace's place and sets replaceWith parent to replace's parent.
+        """
+        parent = self.parent[replace]
+
+        # We are shifting the root, the only node with no parent
+        if parent == NIL:
+            self.root = replaceWith
+        # The node to be replaced is a left child
+        elif replace == self.left[parent]:
+            self.left[parent] = replaceWith
+        # The node to be replaced is a right child
+        else:
+            self.right[parent] = replaceWith
+
+        if replaceWith != NIL:
+            self.parent[replaceWith] = parent
+
+    def delete(self, value):
+        """
+        Delete a node with the value `value` and return its value, or None if there is no such node
+        """
+        currentNode = self.search(value)
+
+        # There's no node with value `value`
+        if currentNode == NIL:
+            return None
+
+        # currentNode has no left children, replace it with its right child
+        if self.left[currentNode] == NIL:
+            self._shiftNodes(currentNode, self.right[currentNode])
+        # currentNode has no right children, replace it with its left child
+        elif self.right[currentNode] == NIL:
+            self._shiftNodes(currentNode, self.left[currentNode])
+        # currentNode has both children, replace it with its successor
+        else:
+            successor = self.minimum(self.right[currentNode])
+
+            # If the successor is not the currentNode's immediate right child
+            if self.parent[successor] != currentNode:
+                self._shiftNodes(successor, self.right[successor])
+                self.right[successor] = self.right[currentNode]
+                self.parent[self.right[successor]] = successor
+
+            self._shiftNodes(currentNode, successor)
+            self.left[successor] = self.left[currentNode]
+            self.parent[self.left[successor]] = successor
+
+        value = self.values[currentNode]
+        self._release(currentNode)
+
+        return value
+
+    def inOrderTraversal(self, node: int) -> list:
+        """
+        Perform an inOrder traversal of a binary tree and return a list containing it.
+        """
+        order = []
+        stack = []
+        currentNode = node
+
+        while stack or currentNode != NIL:
+            # Go as far left as possible, remembering the way back
+            while currentNode != NIL:
+                stack.append(currentNode)
+                currentNode = self.left[currentNode]
+
+            currentNode = stack.pop()
+            order.append(self.values[currentNode])
+            currentNode = self.right[currentNode]
+
+        return order
+
+    def preOrderTraversal(self, node: int) -> list:
+        """
+        Perform an preOrder traversal of a binary tree and return a list containing it.
+        """
+        order = []
+        stack = [node] if node != NIL else []
+
+        while stack:
+            currentNode = stack.pop()
+            order.append(self.values[currentNode])
+
+            # Push right first so the left subtree is visited first
+            if self.right[currentNode] != NIL:
+                stack.append(self.right[currentNode])
+            if self.left[currentNode] != NIL:
+                stack.append(self.left[currentNode])
+
+        return order
+
+    def postOrderTraversal(self, node: int) -> list:
+        """
+        Perform an postOrder traversal of a binary tree and return a list containing it.
+        """
+        order = []
+        stack = [node] if node != NIL else []
+
+        # Node, right, left order reversed is left, right, node
+        while stack:
+            currentNode = stack.pop()
+            order.append(self.values[currentNode])
+
+            if self.left[currentNode] != NIL:
+                stack.append(self.left[currentNode])
+            if self.right[currentNode] != NIL:
+                stack.append(self.right[currentNode])
+
+        order.reverse()
+        return order
@@ -0,0 +1,182 @@
+"""
+    An arena backed linked list. Instead of one Python object per node, the nodes live in parallel columns:
+    a list holding the values and an `array('q')` holding the index of the next node, with -1 standing in for None.
+    A node is just an index into those columns, so each element costs one list slot and one machine integer,
+    there are no node objects for the garbage collector to track, and removed slots are reused through a free list.
+
+    Time Complexity: - Get:            O(n) (linear)
+                     - insertHead:     O(1) (constant)
+                     - insertBetween:  O(n) (linear)
+                     - insertTail:     O(1) (constant)
+                     - remove:         O(n) (linear)
+                     - getValues:      O(n) (linear)
+
+    Space Complexity: - All Cases:     O(n) (linear)
+"""
+
+from array import array
+
+# Index used in place of a missing node
+NIL = -1
+
+
+class ArenaLinkedList:
+    def __init__(self):
+        """Instantiate a empty linked list"""
+        self.values = []
+        self.next = array("q")
+        self.head = self.tail = NIL
+        self.length = 0
+        # Chain of released slots, linked through the `next` column
+        self.free = NIL
+
+    @classmethod
+    def fromIterable(cls, iterable):
+        """Build a linked list holding the values of iterable, in order"""
+        linkedList = cls()
+        linkedList.extend(iterable)
+        return linkedList
+
+    def __len__(self) -> int:
+        """Returns the length of the linked list"""
+        return self.length
+
+    def _allocate(self, value) -> int:
+        """Returns the index of a fresh node holding value, reusing a released slot if there is one"""
+        if self.free != NIL:
+            index = self.free
+            self.free = self.next[index]
+            self.values[index] = value
+            self.next[index] = NIL
+        else:
+            index = len(self.values)
+            self.values.append(value)
+            self.next.append(NIL)
+
+        return index
+
+    def _release(self, index: int):
+        """Puts the slot at index on the free list"""
+        # Drop the reference so the value can be collected
+        self.values[index] = None
+        self.next[index] = self.free
+        self.free = index
+
+    def _walk(self, i: int) -> int:
+        """Returns the index of the i'th node"""
+        currentNode = self.head
+        for _ in range(i):
+            currentNode = self.next[currentNode]
+
+        return currentNode
+
+    def get(self, i: int):
+        """Returns a value at index i if exists or None"""
+        # Out of bounds
+        if i < 0 or i >= self.length:
+            return None
+
+        return self.values[self._walk(i)]
+
+    def insertHead(self, value):
+        """Insert at the beginning of the linked list"""
+        node = self._allocate(value)
+
+        if self.head == NIL:
+            self.tail = node
+        else:
+            self.next[node] = self.head
+        self.head = node
+        self.length += 1
+
+    def insertBetween(self, i: int, value):
+        """Insert between the elements of the linked list, the value ends up at index i"""
+        # Out of bounds
+        if i < 0 or i >= self.length:
+            return None
+
+        if i == 0:
+            return self.insertHead(value)
+
+        node = self._allocate(value)
+        previousNode = self._walk(i - 1)
+
+        self.next[node] = self.next[previousNode]
+        self.next[previousNode] = node
+        self.length += 1
+
+    def insertTail(self, value):
+        """Inserts at the tail of the linked list"""
+        node = self._allocate(value)
+
+        if self.tail == NIL:
+            self.head = node
+        else:
+            self.next[self.tail] = node
+        self.tail = node
+        self.length += 1
+
+    def extend(self, iterable):
+        """Inserts all the values of iterable at the tail, building the chain first and splicing it in once"""
+        start = chainTail = NIL
+        count = 0
+
+        # Link the new slots to each other directly in the next column
+        for value in iterable:
+            node = self._allocate(value)
+            if chainTail == NIL:
+                start = node
+            else:
+                self.next[chainTail] = node
+            chainTail = node
+            count += 1
+
+        # Nothing to splice
+        if count == 0:
+            return
+
+        if self.tail == NIL:
+            self.head = start
+        else:
+            self.next[self.tail] = start
+        self.tail = chainTail
+        self.length += count
+
+    def remove(self, i: int):
+        """Removes the element at index i if exists else None"""
+        # Out of bounds
+        if i < 0 or i >= self.length:
+            return None
+
+        # Special case of removal at head
+        if i == 0:
+            node = self.head
+            self.head = self.next[node]
+            if self.head == NIL:
+                self.tail = NIL
+        else:
+            # Go to the last element before the element to be removed
+            previousNode = self._walk(i - 1)
+            node = self.next[previousNode]
+            self.next[previousNode] = self.next[node]
+
+            # Special case of removal at tail
+            if self.next[previousNode] == NIL:
+                self.tail = previousNode
+
+        value = self.values[node]
+        self._release(node)
+        self.length -= 1
+
+        return value
+
+    def getValues(self) -> list:
+        """Returns the contents of the linked list in array"""
+        result = []
+
+        currentNode = self.head
+        while currentNode != NIL:
+            result.append(self.values[currentNode])
+            currentNode = self.next[currentNode]
+
+        return result
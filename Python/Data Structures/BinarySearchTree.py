@@ -12,70 +12,161 @@
                          - Search: O(n)      (linear)
                          - Insert: O(n)      (linear)
                          - Delete: O(n)      (linear)
+                         - Rank:   O(n)      (linear) {Also select and countRange}
+                         - Depth:  O(n)      (linear)
+                         - Height: O(1)      (constant)
 
                      - Average Case {Non-Degenerate Tree}:
                          - Search: O(log(n)) (logarithmic)
                          - Insert: O(log(n)) (logarithmic)
                          - Delete: O(log(n)) (logarithmic)
+                         - Rank:   O(log(n)) (logarithmic) {Also select and countRange}
+                         - Depth:  O(log(n)) (logarithmic)
+                         - Height: O(1)      (constant)
 
     Space Complexity: - All Cases: O(n)      (linear)
 """
 
+from heapq import merge
+
 
 class Node:
+    # No per-instance __dict__, a node only ever has these seven attributes
+    __slots__ = ("value", "key", "parent", "left", "right", "size", "height")
+
     def __init__(
         self,
         value,
     ):
         self.value = value
+        # What the tree orders the node by, set by the tree on insertion
+        self.key = value
         self.parent = None
         self.left = None
         self.right = None
+        # Number of nodes in the subtree rooted at this node
+        self.size = 1
+        # A new node is always a leaf
+        self.height = 0
 
 
 class BST:
-    def __init__(self):
+    # The node type created by the bulk builders, subclasses with their own node type override it
+    nodeClass = Node
+
+    def __init__(self, key=None):
+        """
+        Instantiate an empty tree. The nodes are ordered by key(value) if a `key` function is given, else by their values.
+        The key of a node is computed once when it's inserted and kept on the node.
+        """
         self.root = None
+        self.keyFunction = key
+
+    def _keyOf(self, value):
+        """The key the tree orders value by"""
+        return value if self.keyFunction is None else self.keyFunction(value)
+
+    def _newNode(self, value) -> Node:
+        """Create a node for value, with its key already computed"""
+        node = self.nodeClass(value)
+        node.key = self._keyOf(value)
+        return node
+
+    @classmethod
+    def fromSorted(cls, iterable, key=None):
+        """
+        Build a perfectly balanced tree from values that are already in sorted order (by `key`, if given), in O(n).
+        Every subtree is rooted at the middle value of its range, so no comparisons or rebalancing are needed.
+        """
+        tree = cls(key)
+        tree.root = tree._link([tree._newNode(value) for value in iterable])
+        return tree
+
+    def bulkInsert(self, iterable):
+        """
+        Insert many values at once. The values are sorted, merged with the in-order nodes of the tree and the whole tree
+        is relinked into a perfectly balanced one, in O(n + m * log(m)) for m new values.
+        Existing nodes are reused, so references to them stay valid.
+        Equal keys end up in the same order as if the values were inserted one by one with `insert`:
+        every value goes in front of the nodes with an equal key that were already in the tree.
+        """
+        newNodes = [self._newNode(value) for value in iterable]
+        # The sort is stable, so sorting the reversed values puts later equal values first
+        newNodes.reverse()
+        newNodes.sort(key=lambda node: node.key)
+        # merge takes equal keys from its first iterable first, so the new nodes go first
+        nodes = list(merge(newNodes, self._inOrderNodes(self.root), key=lambda node: node.key))
+        self.root = self._link(nodes)
+
+    def _link(self, nodes: list) -> Node:
+        """
+        Link the sorted nodes into a perfectly balanced subtree and return its root.
+        """
+
+        def build(low: int, high: int, parent: Node) -> Node:
+            # Empty range
+            if low >= high:
+                return None
+
+            # The middle node is the root, the halves on either side are its subtrees
+            middle = (low + high) // 2
+            node = nodes[middle]
+            node.parent = parent
+            node.left = build(low, middle, node)
+            node.right = build(middle + 1, high, node)
+
+            # Both subtrees are final, so the node's own data can be computed
+            self._updateNode(node)
+            return node
+
+        # The recursion is only log(n) deep, since the ranges are halved every time
+        return build(0, len(nodes), None)
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the tree"""
+        return self.size(self.root)
+
+    def size(self, node: Node) -> int:
+        """
+        The number of nodes in the subtree rooted at node. It's stored on the node, so no walk over the subtree is needed.
+        """
+        if node is None:
+            return 0
+        return node.size
 
     def depth(self, node: Node) -> int:
         """
-        The depth of a node is the number of edges present in path from the root node of a tree to that node
+        The depth of a node is the number of edges present in path from the root node of a tree to that node.
+        It's counted by following the parent pointers up, so with duplicate keys it's the depth of this very node.
+        A node that isn't in the tree stands for the node with the same key, -1 if there is none.
         """
-        currentNode = self.root
+        currentNode = node
         currentDepth = 0
 
-        while currentNode:
-            # Found the node
-            if node.value == currentNode.value:
-                return currentDepth
-            # Go left
-            elif node.value <= currentNode.value:
-                currentNode = currentNode.left
-            # Go right
-            else:
-                currentNode = currentNode.right
-            # The node is further down
+        while currentNode.parent is not None:
+            currentNode = currentNode.parent
             currentDepth += 1
 
+        # The node is in the tree
+        if currentNode is self.root:
+            return currentDepth
+
+        found = self.find(self._keyOf(node.value))
         # Node doesn't exist
-        return -1
+        if found is None:
+            return -1
+        return self.depth(found)
 
     def height(self, node: Node) -> int:
         """
         The height of a node in a binary tree is the largest number of edges in a path from a leaf node to a target node.
+        It's stored on the node, so no walk over the subtree is needed.
         """
         # The parent is a leaf node, so it has 0 height
         # So to counter the +1 in the general case, return -1 in the base case
         if node is None:
             return -1
-        else:
-            # Get the height of left subtree
-            leftHeight = self.height(node.left)
-            # Get the height of right subtree
-            rightHeight = self.height(node.right)
-
-            # Return the maximum height
-            return max(leftHeight, rightHeight) + 1
+        return node.height
 
     def search(self, node: Node) -> Node:
         """
@@ -84,15 +175,21 @@ class BST:
         if node is None:
             return None
 
+        return self.find(self._keyOf(node.value))
+
+    def find(self, key) -> Node:
+        """
+        Search for a node with the key `key` (its value, unless the tree has a key function), without having to wrap the key in a Node first.
+        """
         currentNode = self.root
 
         # Search until we reach a leaf node
         while currentNode:
             # Found the node
-            if node.value == currentNode.value:
+            if key == currentNode.key:
                 return currentNode
             # Node is in the left subtree
-            elif node.value <= currentNode.value:
+            elif key <= currentNode.key:
                 currentNode = currentNode.left
             # Node is in the right subtree
             else:
@@ -101,6 +198,127 @@ class BST:
         # Node not found
         return None
 
+    def lowerBound(self, key) -> Node:
+        """
+        Find the first node (in in-order) whose key is not less than `key`, like `bisect_left`.
+        """
+        currentNode = self.root
+        bound = None
+
+        while currentNode:
+            # Candidate, but there may be a smaller one on the left
+            if currentNode.key >= key:
+                bound = currentNode
+                currentNode = currentNode.left
+            else:
+                currentNode = currentNode.right
+
+        return bound
+
+    def upperBound(self, key) -> Node:
+        """
+        Find the first node (in in-order) whose key is greater than `key`, like `bisect_right`.
+        """
+        currentNode = self.root
+        bound = None
+
+        while currentNode:
+            # Candidate, but there may be a smaller one on the left
+            if currentNode.key > key:
+                bound = currentNode
+                currentNode = currentNode.left
+            else:
+                currentNode = currentNode.right
+
+        return bound
+
+    def floor(self, key) -> Node:
+        """
+        Find the last node (in in-order) whose key is less than or equal to `key`.
+        """
+        currentNode = self.root
+        bound = None
+
+        while currentNode:
+            # Candidate, but there may be a larger one on the right
+            if currentNode.key <= key:
+                bound = currentNode
+                currentNode = currentNode.right
+            else:
+                currentNode = currentNode.left
+
+        return bound
+
+    def ceiling(self, key) -> Node:
+        """
+        Find the first node (in in-order) whose key is greater than or equal to `key`.
+        """
+        return self.lowerBound(key)
+
+    def rank(self, key) -> int:
+        """
+        The number of nodes whose key is less than `key`, which is the index `key` would have in the sorted order.
+        Every time the search goes right, the left subtree and the node itself are all smaller, so their count is added.
+        """
+        currentNode = self.root
+        rank = 0
+
+        while currentNode:
+            # The node and its left subtree are smaller, count them and go right
+            if currentNode.key < key:
+                rank += self.size(currentNode.left) + 1
+                currentNode = currentNode.right
+            else:
+                currentNode = currentNode.left
+
+        return rank
+
+    def select(self, k: int) -> Node:
+        """
+        Find the node with the k-th smallest key (counting from 0, negative k counts from the largest like list indices).
+        The subtree sizes tell which side of every node the k-th key is on, so it takes O(h).
+        """
+        length = self.size(self.root)
+        if k < 0:
+            k += length
+        if not 0 <= k < length:
+            raise IndexError("select index out of range")
+
+        currentNode = self.root
+
+        while True:
+            leftSize = self.size(currentNode.left)
+
+            # The k-th key is in the left subtree
+            if k < leftSize:
+                currentNode = currentNode.left
+            # The node itself is the k-th key
+            elif k == leftSize:
+                return currentNode
+            # Skip the left subtree and the node, look for the rest in the right subtree
+            else:
+                k -= leftSize + 1
+                currentNode = currentNode.right
+
+    def countRange(self, low, high) -> int:
+        """
+        The number of nodes whose keys are in [low, high), in O(h) without visiting them like `range` does.
+        """
+        if not low < high:
+            return 0
+        return self.rank(high) - self.rank(low)
+
+    def range(self, low, high):
+        """
+        Lazily yield the values whose keys are in [low, high), in sorted order.
+        Finds the first value with `lowerBound` and then follows successors, so k values cost O(h + k).
+        """
+        currentNode = self.lowerBound(low)
+
+        while currentNode and currentNode.key < high:
+            yield currentNode.value
+            currentNode = self.successor(currentNode)
+
     def maximum(self, node: Node) -> Node:
         """Find the right most node in the node's right subtree"""
 
@@ -159,6 +377,11 @@ class BST:
         """
         Inserts a node in the tree with the value `value` and return the inserted node.
         """
+        node.key = self._keyOf(node.value)
+        # The node always goes in as a leaf
+        node.size = 1
+        node.height = 0
+
         # The tree is empty, insert a root node with `value`
         if self.root is None:
             self.root = node
@@ -166,8 +389,11 @@ class BST:
             currentNode = self.root
 
             while currentNode:
+                # The node ends up somewhere in this subtree
+                currentNode.size += 1
+
                 # Go left
-                if node.value <= currentNode.value:
+                if node.key <= currentNode.key:
                     # Current node has a left child, go down
                     if currentNode.left is not None:
                         currentNode = currentNode.left
@@ -187,7 +413,16 @@ class BST:
                         currentNode.right.parent = currentNode
                         break
 
-            return node
+        # Only the heights on the way up can grow, and only until one of them doesn't
+        currentNode = node.parent
+        while currentNode is not None:
+            height = max(self.height(currentNode.left), self.height(currentNode.right)) + 1
+            if height == currentNode.height:
+                break
+            currentNode.height = height
+            currentNode = currentNode.parent
+
+        return node
 
     def _shiftNodes(self, replace: Node, replaceWith: Node):
         """
@@ -209,29 +444,107 @@ class BST:
         if replaceWith is not None:
             replaceWith.parent = replace.parent
 
+    def _updateNode(self, node: Node):
+        """
+        Hook called bottom-up on every node whose subtree changed shape during a rotation.
+        Recomputes the subtree size and height, subclasses that store more per-node data extend this to keep it up to date.
+        """
+        node.size = self.size(node.left) + self.size(node.right) + 1
+        node.height = max(self.height(node.left), self.height(node.right)) + 1
+
+    def _updatePath(self, node: Node):
+        """
+        Call _updateNode on node and every node above it, after the subtree below node changed.
+        """
+        while node is not None:
+            self._updateNode(node)
+            node = node.parent
+
+    def _rotateLeft(self, node: Node) -> Node:
+        """
+        Rotate the subtree rooted at node to the left and return the new root of the subtree.
+        The node's right child takes its place and the node becomes that child's left child.
+        """
+        pivot = node.right
+
+        # The pivot's left subtree becomes the node's right subtree
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+
+        # Put the pivot in the node's place and hang the node on its left
+        self._shiftNodes(node, pivot)
+        pivot.left = node
+        node.parent = pivot
+
+        # node is now below pivot, so update it first
+        self._updateNode(node)
+        self._updateNode(pivot)
+        return pivot
+
+    def _rotateRight(self, node: Node) -> Node:
+        """
+        Rotate the subtree rooted at node to the right and return the new root of the subtree.
+        The node's left child takes its place and the node becomes that child's right child.
+        """
+        pivot = node.left
+
+        # The pivot's right subtree becomes the node's left subtree
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+
+        # Put the pivot in the node's place and hang the node on its right
+        self._shiftNodes(node, pivot)
+        pivot.right = node
+        node.parent = pivot
+
+        # node is now below pivot, so update it first
+        self._updateNode(node)
+        self._updateNode(pivot)
+        return pivot
+
     def delete(self, node: Node) -> Node:
         """
         Delete a node with the value `value`
         """
-        currentNode = self.search(node)
+        return self.deleteKey(self._keyOf(node.value))
+
+    def deleteKey(self, key) -> Node:
+        """
+        Delete a node with the key `key` and return it, without having to wrap the key in a Node first
+        """
+        currentNode = self.find(key)
 
-        # There's no node with value `value`
+        # There's no node with value `key`
         if currentNode is None:
             return currentNode
 
+        self._deleteNode(currentNode)
+        return currentNode
+
+    def _deleteNode(self, currentNode: Node) -> Node:
+        """
+        Unlink currentNode from the tree.
+        Returns the deepest node whose subtree lost a node, which is where rebalancing has to start (None if that's above the root)
+        """
         # currentNode has no left children, replace it with its right child
         if currentNode.left is None:
+            lowest = currentNode.parent
             self._shiftNodes(currentNode, currentNode.right)
         # currentNode has no right children, replace it with its left child
         elif currentNode.right is None:
+            lowest = currentNode.parent
             self._shiftNodes(currentNode, currentNode.left)
         # currentNode has either no children, or has both children
         else:
             # Replace currentNode with its successor
             successor = self.successor(currentNode)
+            lowest = successor
 
             # If the successor is not the currentNode's immediate right child
             if successor.parent != currentNode:
+                lowest = successor.parent
                 # Shift successor's right child in place of successor
                 self._shiftNodes(successor, successor.right)
                 # Assign the currentNode's right subtree to the successor
@@ -247,49 +560,126 @@ class BST:
             # Make successor the parent of the left subtree
             successor.left.parent = successor
 
-        return currentNode
+        self._detach(currentNode)
 
-    def inOrderTraversal(self, node: Node) -> list:
+        # Every subtree on the way up to the root lost a node
+        self._updatePath(lowest)
+        return lowest
+
+    def _detach(self, node: Node):
         """
-        Perform an inOrder traversal of a binary tree and return a list containing it.
+        Clear the links and data of a node that was unlinked from the tree, so it reads like a new node.
+        Its stale parent pointer would otherwise lead `depth` up to the root.
+        """
+        node.parent = node.left = node.right = None
+        node.size = 1
+        node.height = 0
+
+    def __iter__(self):
+        """Lazily yield the values of the tree in sorted order"""
+        return self.inOrderIter(self.root)
+
+    def __reversed__(self):
+        """Lazily yield the values of the tree in reverse sorted order"""
+        return self.reverseInOrderIter(self.root)
+
+    def inOrderIter(self, node: Node):
+        """
+        Lazily perform an inOrder traversal of a binary tree, using an explicit stack of at most h nodes instead of recursion.
+        """
+        for currentNode in self._inOrderNodes(node):
+            yield currentNode.value
+
+    def _inOrderNodes(self, node: Node):
+        """
+        Lazily yield the nodes of the subtree rooted at node in in-order.
         """
-        order = []
-        if node is not None:
-            # inOrderTraverse the left subtree
-            order.extend(self.inOrderTraversal(node.left))
-            # Append the current node
-            order.append(node.value)
+        stack = []
+        currentNode = node
+
+        while stack or currentNode:
+            # Go as far left as possible, remembering the way back
+            while currentNode:
+                stack.append(currentNode)
+                currentNode = currentNode.left
+
+            currentNode = stack.pop()
+            yield currentNode
             # inOrderTraverse the right subtree
-            order.extend(self.inOrderTraversal(node.right))
+            currentNode = currentNode.right
 
-        return order
+    def reverseInOrderIter(self, node: Node):
+        """
+        Lazily perform a reversed inOrder traversal (right, node, left) of a binary tree.
+        """
+        stack = []
+        currentNode = node
+
+        while stack or currentNode:
+            # Go as far right as possible, remembering the way back
+            while currentNode:
+                stack.append(currentNode)
+                currentNode = currentNode.right
+
+            currentNode = stack.pop()
+            yield currentNode.value
+            # Traverse the left subtree
+            currentNode = currentNode.left
+
+    def preOrderIter(self, node: Node):
+        """
+        Lazily perform a preOrder traversal of a binary tree, using an explicit stack instead of recursion.
+        """
+        stack = [node] if node else []
+
+        while stack:
+            currentNode = stack.pop()
+            yield currentNode.value
+
+            # Push the right child first, so the left subtree comes out first
+            if currentNode.right:
+                stack.append(currentNode.right)
+            if currentNode.left:
+                stack.append(currentNode.left)
+
+    def postOrderIter(self, node: Node):
+        """
+        Lazily perform a postOrder traversal of a binary tree, using an explicit stack instead of recursion.
+        """
+        stack = []
+        currentNode = node
+        lastVisited = None
+
+        while stack or currentNode:
+            # Go as far left as possible, remembering the way back
+            while currentNode:
+                stack.append(currentNode)
+                currentNode = currentNode.left
+
+            top = stack[-1]
+            # The right subtree exists and hasn't been traversed yet, traverse it first
+            if top.right and top.right is not lastVisited:
+                currentNode = top.right
+            # Both subtrees are done, visit the node itself
+            else:
+                stack.pop()
+                yield top.value
+                lastVisited = top
+
+    def inOrderTraversal(self, node: Node) -> list:
+        """
+        Perform an inOrder traversal of a binary tree and return a list containing it.
+        """
+        return list(self.inOrderIter(node))
 
     def preOrderTraversal(self, node: Node) -> list:
         """
         Perform an preOrder traversal of a binary tree and return a list containing it.
         """
-        order = []
-        if node is not None:
-            # Append the current node
-            order.append(node.value)
-            # preOrderTraverse the left subtree
-            order.extend(self.preOrderTraversal(node.left))
-            # preOrderTraverse the right subtree
-            order.extend(self.preOrderTraversal(node.right))
-
-        return order
+        return list(self.preOrderIter(node))
 
     def postOrderTraversal(self, node: Node) -> list:
         """
         Perform an postOrder traversal of a binary tree and return a list containing it.
         """
-        order = []
-        if node is not None:
-            # postOrderTraverse the left subtree
-            order.extend(self.postOrderTraversal(node.left))
-            # postOrderTraverse the right subtree
-            order.extend(self.postOrderTraversal(node.right))
-            # Append the current node
-            order.append(node.value)
-
-        return order
+        return list(self.postOrderIter(node))
@@ -0,0 +1,153 @@
+"""
+    A thread-safe binary search tree guarded by a reader-writer lock.
+    Any number of threads can search the tree at the same time, while inserting or deleting takes the tree for itself.
+    Waiting writers are preferred over new readers, so a steady stream of searches can't starve the writers.
+
+    It wraps any of the trees (`BST`, `AVLTree`, `RedBlackTree`) and has the same time complexities as the wrapped tree.
+    Traversals return a list copied under the read lock, instead of lazily yielding from a tree that may change underneath.
+
+    Space Complexity: - All Cases: O(n) (linear)
+"""
+
+from contextlib import contextmanager
+from threading import Condition, Lock
+
+from BinarySearchTree import BST, Node
+
+
+class ReadWriteLock:
+    def __init__(self):
+        """Instantiate an unlocked reader-writer lock"""
+        self._condition = Condition(Lock())
+        self._readers = 0
+        self._writing = False
+        self._waitingWriters = 0
+
+    def acquireRead(self):
+        """Wait until no writer holds or waits for the lock, then hold it as one more reader"""
+        with self._condition:
+            while self._writing or self._waitingWriters:
+                self._condition.wait()
+            self._readers += 1
+
+    def releaseRead(self):
+        with self._condition:
+            self._readers -= 1
+            # The last reader lets the writers in
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquireWrite(self):
+        """Wait until there are no readers and no other writer, then hold the lock alone"""
+        with self._condition:
+            self._waitingWriters += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._waitingWriters -= 1
+            self._writing = True
+
+    def releaseWrite(self):
+        with self._condition:
+            self._writing = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def reading(self):
+        """Hold the lock as a reader for the duration of a with block"""
+        self.acquireRead()
+        try:
+            yield
+        finally:
+            self.releaseRead()
+
+    @contextmanager
+    def writing(self):
+        """Hold the lock as the writer for the duration of a with block"""
+        self.acquireWrite()
+        try:
+            yield
+        finally:
+            self.releaseWrite()
+
+
+class ConcurrentBST:
+    def __init__(self, tree: BST = None):
+        """Wrap tree (a new empty `BST` if None), which must not be used directly anymore"""
+        self.tree = BST() if tree is None else tree
+        self.lock = ReadWriteLock()
+
+    def __len__(self) -> int:
+        with self.lock.reading():
+            return len(self.tree)
+
+    def __contains__(self, key) -> bool:
+        with self.lock.reading():
+            return self.tree.find(key) is not None
+
+    def find(self, key) -> Node:
+        with self.lock.reading():
+            return self.tree.find(key)
+
+    def lowerBound(self, key) -> Node:
+        with self.lock.reading():
+            return self.tree.lowerBound(key)
+
+    def upperBound(self, key) -> Node:
+        with self.lock.reading():
+            return self.tree.upperBound(key)
+
+    def floor(self, key) -> Node:
+        with self.lock.reading():
+            return self.tree.floor(key)
+
+    def ceiling(self, key) -> Node:
+        with self.lock.reading():
+            return self.tree.ceiling(key)
+
+    def rank(self, key) -> int:
+        with self.lock.reading():
+            return self.tree.rank(key)
+
+    def select(self, k: int) -> Node:
+        with self.lock.reading():
+            return self.tree.select(k)
+
+    def countRange(self, low, high) -> int:
+        with self.lock.reading():
+            return self.tree.countRange(low, high)
+
+    def range(self, low, high) -> list:
+        """Returns the values whose keys are in [low, high), in sorted order"""
+        with self.lock.reading():
+            return list(self.tree.range(low, high))
+
+    def insert(self, node: Node) -> Node:
+        with self.lock.writing():
+            return self.tree.insert(node)
+
+    def bulkInsert(self, iterable):
+        # Build the list first, so the iterable isn't consumed while holding the lock
+        values = list(iterable)
+        with self.lock.writing():
+            self.tree.bulkInsert(values)
+
+    def delete(self, node: Node) -> Node:
+        with self.lock.writing():
+            return self.tree.delete(node)
+
+    def deleteKey(self, key) -> Node:
+        with self.lock.writing():
+            return self.tree.deleteKey(key)
+
+    def inOrderTraversal(self) -> list:
+        """Returns the values of the tree in sorted order"""
+        with self.lock.reading():
+            return self.tree.inOrderTraversal(self.tree.root)
+
+    def preOrderTraversal(self) -> list:
+        with self.lock.reading():
+            return self.tree.preOrderTraversal(self.tree.root)
+
+    def postOrderTraversal(self) -> list:
+        with self.lock.reading():
+            return self.tree.postOrderTraversal(self.tree.root)
@@ -0,0 +1,180 @@
+"""
+    A thread-safe linked list meant to be used as a multi-producer, multi-consumer (MPMC) queue.
+    It's the two-lock queue of Michael and Scott: the list always starts with a sentinel node, so the head and the tail
+    never point at the same real node, and one lock guards each end. Producers appending at the tail and consumers
+    popping from the head take different locks and never wait for one another, only for others working on the same end.
+
+    A counting semaphore tracks the number of values, so `popHead` can block until a value arrives,
+    and `popHeadAsync` waits for one from asyncio code without blocking the event loop.
+
+    Time Complexity: - insertHead:     O(1) (constant)
+                     - insertTail:     O(1) (constant)
+                     - popHead:        O(1) (constant) {Plus the wait for a value}
+                     - getValues:      O(n) (linear)
+
+    Space Complexity: - All Cases:     O(n) (linear)
+"""
+
+import asyncio
+from threading import Lock, Semaphore
+
+from LinkedList import Node
+
+
+def _wake(waiter: asyncio.Future):
+    """Runs on the waiter's event loop, resolves it unless it was cancelled in the meantime"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class ConcurrentLinkedList:
+    def __init__(self):
+        """Instantiate a empty linked list"""
+        # The sentinel, the first value is in head.next
+        self.head = self.tail = Node(None)
+        self.headLock = Lock()
+        self.tailLock = Lock()
+        # Counts the values that can be popped
+        self._available = Semaphore(0)
+        # Each counter is only changed under the lock of its own end
+        self._inserted = 0
+        self._popped = 0
+        # asyncio consumers waiting for a value, as (loop, future) pairs
+        self._waiters = []
+        self._waitersLock = Lock()
+
+    @classmethod
+    def fromIterable(cls, iterable):
+        """Build a linked list holding the values of iterable, in order"""
+        linkedList = cls()
+        linkedList.extend(iterable)
+        return linkedList
+
+    def __len__(self) -> int:
+        """Returns the length of the linked list, which may already be outdated when other threads are using it"""
+        return self._inserted - self._popped
+
+    def _wakeOne(self):
+        """Hand a wake-up to the longest waiting asyncio consumer, if there is one. Called with _waitersLock held"""
+        if self._waiters:
+            loop, waiter = self._waiters.pop(0)
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def _added(self, count: int):
+        """Announce count new values to the blocked consumers"""
+        for _ in range(count):
+            self._available.release()
+
+        with self._waitersLock:
+            for _ in range(min(count, len(self._waiters))):
+                self._wakeOne()
+
+    def insertHead(self, value):
+        """Insert at the beginning of the linked list"""
+        node = Node(value)
+
+        # The list may be empty, then the tail has to move as well. Always head before tail, so the locks can't deadlock
+        with self.headLock, self.tailLock:
+            node.next = self.head.next
+            self.head.next = node
+            if self.tail is self.head:
+                self.tail = node
+            self._inserted += 1
+
+        self._added(1)
+
+    def insertTail(self, value):
+        """Inserts at the tail of the linked list"""
+        node = Node(value)
+
+        with self.tailLock:
+            self.tail.next = node
+            self.tail = node
+            self._inserted += 1
+
+        self._added(1)
+
+    def extend(self, iterable):
+        """Inserts all the values of iterable at the tail, building the chain first and splicing it in under the lock once"""
+        start = chainTail = Node(None)
+        count = 0
+
+        for value in iterable:
+            chainTail.next = Node(value)
+            chainTail = chainTail.next
+            count += 1
+
+        # Nothing to splice
+        if count == 0:
+            return
+
+        with self.tailLock:
+            self.tail.next = start.next
+            self.tail = chainTail
+            self._inserted += count
+
+        self._added(count)
+
+    def _unlinkHead(self):
+        """Remove and return the first value, one has to be reserved through _available first"""
+        with self.headLock:
+            # The first real node becomes the new sentinel
+            node = self.head.next
+            self.head = node
+            self._popped += 1
+
+            value = node.value
+            # Drop the reference so the value can be collected
+            node.value = None
+            return value
+
+    def popHead(self, block: bool = True, timeout: float = None):
+        """
+        Removes and returns the first value. If the list is empty, waits until another thread inserts one (at most
+        timeout seconds, forever if None), or returns None right away with block=False. Returns None if no value came in time.
+        """
+        if not self._available.acquire(block, timeout):
+            return None
+        return self._unlinkHead()
+
+    async def popHeadAsync(self):
+        """
+        Removes and returns the first value, awaiting one if the list is empty. The event loop keeps running while it waits.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Checking for a value and registering as a waiter have to happen together, or a wake-up could be missed
+            with self._waitersLock:
+                if self._available.acquire(blocking=False):
+                    break
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._waitersLock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+                    # A producer already picked this waiter, pass its wake-up on to the next one
+                    else:
+                        self._wakeOne()
+                raise
+
+            # Woken up, but a blocking consumer may have taken the value first, so check again
+
+        return self._unlinkHead()
+
+    def getValues(self) -> list:
+        """Returns the contents of the linked list in array"""
+        result = []
+
+        # Both ends locked, the list can't change while it's copied
+        with self.headLock, self.tailLock:
+            currentNode = self.head.next
+            while currentNode:
+                result.append(currentNode.value)
+                currentNode = currentNode.next
+
+        return result
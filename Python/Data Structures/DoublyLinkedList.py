@@ -0,0 +1,192 @@
+"""
+    A doubly linked list is a linked list in which every node also keeps a link to the previous node.
+    The back links make removal at the tail a constant time operation, since the new tail is directly reachable,
+    and positional operations can walk from whichever end of the list is closer to the index.
+
+    Time Complexity: - Get:            O(n) (linear) {At most n / 2 steps}
+                     - insertHead:     O(1) (constant)
+                     - insertBetween:  O(n) (linear) {At most n / 2 steps}
+                     - insertTail:     O(1) (constant)
+                     - remove:         O(n) (linear) {At most n / 2 steps}
+                     - popHead:        O(1) (constant)
+                     - popTail:        O(1) (constant)
+                     - getValues:      O(n) (linear)
+
+    Space Complexity: - All Cases:     O(n) (linear)
+"""
+
+
+class Node:
+    # No per-instance __dict__, a node only ever has these three attributes
+    __slots__ = ("value", "prev", "next")
+
+    def __init__(self, value):
+        """Instantiates a new doubly linked list node with value"""
+        self.value = value
+        self.prev = None
+        self.next = None
+
+
+class DoublyLinkedList:
+    def __init__(self):
+        """Instantiate a empty doubly linked list"""
+        self.head = self.tail = None
+        self.length = 0
+
+    @classmethod
+    def fromIterable(cls, iterable):
+        """Build a doubly linked list holding the values of iterable, in order"""
+        linkedList = cls()
+        linkedList.extend(iterable)
+        return linkedList
+
+    def __len__(self) -> int:
+        """Returns the length of the linked list"""
+        return self.length
+
+    def _node(self, i: int) -> Node:
+        """Returns the i'th node, walking from the closer end of the list"""
+        if i < self.length // 2:
+            currentNode = self.head
+            for _ in range(i):
+                currentNode = currentNode.next
+        else:
+            currentNode = self.tail
+            for _ in range(self.length - 1 - i):
+                currentNode = currentNode.prev
+
+        return currentNode
+
+    def _unlink(self, node: Node):
+        """Takes node out of the list"""
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.prev = node.next = None
+        self.length -= 1
+
+    def get(self, i: int):
+        """Returns a value at index i if exists or None"""
+        # Out of bounds
+        if i < 0 or i >= self.length:
+            return None
+
+        return self._node(i).value
+
+    def insertHead(self, value):
+        """Insert at the beginning of the linked list"""
+        node = Node(value)
+
+        if self.head is None:
+            self.tail = node
+        else:
+            node.next = self.head
+            self.head.prev = node
+        self.head = node
+        self.length += 1
+
+    def insertBetween(self, i: int, value):
+        """Insert between the elements of the linked list, the value ends up at index i"""
+        # Out of bounds
+        if i < 0 or i >= self.length:
+            return None
+
+        # Special case of insertion at head, there is no element before it
+        if i == 0:
+            return self.insertHead(value)
+
+        # Link the new node in right before the current i'th node
+        nextNode = self._node(i)
+        node = Node(value)
+        node.prev = nextNode.prev
+        node.next = nextNode
+        nextNode.prev.next = node
+        nextNode.prev = node
+        self.length += 1
+
+    def insertTail(self, value):
+        """Inserts at the tail of the linked list"""
+        node = Node(value)
+
+        if self.tail is None:
+            self.head = node
+        else:
+            node.prev = self.tail
+            self.tail.next = node
+        self.tail = node
+        self.length += 1
+
+    def extend(self, iterable):
+        """Inserts all the values of iterable at the tail, building the chain first and splicing it in once"""
+        # A placeholder node in front of the chain, so linking the first value isn't a special case
+        start = chainTail = Node(None)
+        count = 0
+
+        for value in iterable:
+            node = Node(value)
+            node.prev = chainTail
+            chainTail.next = node
+            chainTail = node
+            count += 1
+
+        # Nothing to splice
+        if count == 0:
+            return
+
+        first = start.next
+        first.prev = self.tail
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = chainTail
+        self.length += count
+
+    def remove(self, i: int):
+        """Removes the element at index i if exists else None"""
+        # Out of bounds
+        if i < 0 or i >= self.length:
+            return None
+
+        node = self._node(i)
+        self._unlink(node)
+
+        return node.value
+
+    def popHead(self):
+        """Removes the first element if exists else None"""
+        if self.head is None:
+            return None
+
+        node = self.head
+        self._unlink(node)
+
+        return node.value
+
+    def popTail(self):
+        """Removes the last element if exists else None"""
+        if self.tail is None:
+            return None
+
+        node = self.tail
+        self._unlink(node)
+
+        return node.value
+
+    def getValues(self) -> list:
+        """Returns the contents of the linked list in array"""
+        result = []
+
+        currentNode = self.head
+        while currentNode:
+            result.append(currentNode.value)
+            currentNode = currentNode.next
+
+        return result
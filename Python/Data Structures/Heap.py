@@ -0,0 +1,156 @@
+"""
+    A heap is a tree-based data structure that satisfies the heap property: the priority of every node is less than or
+    equal to the priorities of its children, so the item with the smallest priority is always at the root.
+    This is a d-ary min heap stored in a list: the children of index i are at d * i + 1 ... d * i + d.
+    A larger fan-out makes the tree shallower, which makes pushing and decreasing a priority cheaper,
+    at the cost of comparing more children on every level of a pop. d = 2 is the usual binary heap.
+
+    Every item's index in the heap is kept in a dictionary, so the priority of an item already in the heap can be
+    decreased (or the item removed) without searching for it, which is what Dijkstra's and Prim's algorithms need.
+    Items therefore have to be hashable and can only be in the heap once.
+
+    Time Complexity: - fromIterable:    O(n)            (linear) {Bottom-up heapify}
+                     - push:            O(log_d(n))     (logarithmic)
+                     - peek:            O(1)            (constant)
+                     - pop:             O(d * log_d(n)) (logarithmic)
+                     - decreaseKey:     O(log_d(n))     (logarithmic)
+                     - remove:          O(d * log_d(n)) (logarithmic)
+
+    Space Complexity: - All Cases:      O(n)            (linear)
+"""
+
+
+class Heap:
+    def __init__(self, arity: int = 2):
+        """Instantiate an empty heap where every node has up to arity children"""
+        if arity < 2:
+            raise ValueError(f"a heap needs an arity of at least 2, got {arity}")
+
+        self.arity = arity
+        self.items = []
+        self.priorities = []
+        # Index of every item in the two lists above
+        self.positions = {}
+
+    @classmethod
+    def fromIterable(cls, iterable, arity: int = 2, priority=None):
+        """
+        Build a heap of the items of iterable in O(n), each with priority(item) as its priority (the item itself if None).
+        """
+        heap = cls(arity)
+        for item in iterable:
+            if item in heap.positions:
+                raise ValueError(f"{item!r} is already in the heap")
+
+            heap.positions[item] = len(heap.items)
+            heap.items.append(item)
+            heap.priorities.append(item if priority is None else priority(item))
+
+        # Sift down every node that has children, the last one first, so each subtree is a heap before its parent joins it
+        for index in range((len(heap.items) - 2) // arity, -1, -1):
+            heap._siftDown(index)
+        return heap
+
+    def __len__(self) -> int:
+        """Returns the number of items in the heap"""
+        return len(self.items)
+
+    def __contains__(self, item) -> bool:
+        """Whether item is in the heap"""
+        return item in self.positions
+
+    def _place(self, index: int, item, priority):
+        """Store item with priority at index"""
+        self.items[index] = item
+        self.priorities[index] = priority
+        self.positions[item] = index
+
+    def _siftUp(self, index: int):
+        """Move the item at index up until its parent's priority isn't greater than its own"""
+        item, priority = self.items[index], self.priorities[index]
+
+        # Shift the parents down into the hole instead of swapping, and put the item in once at the end
+        while index > 0:
+            parent = (index - 1) // self.arity
+            if not priority < self.priorities[parent]:
+                break
+            self._place(index, self.items[parent], self.priorities[parent])
+            index = parent
+
+        self._place(index, item, priority)
+
+    def _siftDown(self, index: int):
+        """Move the item at index down until none of its children has a smaller priority"""
+        item, priority = self.items[index], self.priorities[index]
+        length = len(self.items)
+
+        while True:
+            first = self.arity * index + 1
+            if first >= length:
+                break
+
+            # Find the child with the smallest priority
+            child = first
+            for other in range(first + 1, min(first + self.arity, length)):
+                if self.priorities[other] < self.priorities[child]:
+                    child = other
+
+            if not self.priorities[child] < priority:
+                break
+            self._place(index, self.items[child], self.priorities[child])
+            index = child
+
+        self._place(index, item, priority)
+
+    def push(self, item, priority=None):
+        """Add item to the heap, with priority as its priority (the item itself if None)"""
+        if item in self.positions:
+            raise ValueError(f"{item!r} is already in the heap")
+
+        self.items.append(item)
+        self.priorities.append(item if priority is None else priority)
+        self._siftUp(len(self.items) - 1)
+
+    def peek(self):
+        """Returns the item with the smallest priority without removing it"""
+        if not self.items:
+            raise IndexError("peek from an empty heap")
+        return self.items[0]
+
+    def pop(self):
+        """Removes and returns the item with the smallest priority"""
+        if not self.items:
+            raise IndexError("pop from an empty heap")
+
+        top = self.items[0]
+        self.remove(top)
+        return top
+
+    def priority(self, item):
+        """Returns the priority of item"""
+        return self.priorities[self.positions[item]]
+
+    def decreaseKey(self, item, priority):
+        """Lower the priority of item, which is already in the heap, to priority"""
+        index = self.positions[item]
+        if self.priorities[index] < priority:
+            raise ValueError(f"{priority!r} is greater than the current priority of {item!r}")
+
+        self.priorities[index] = priority
+        self._siftUp(index)
+
+    def remove(self, item):
+        """Removes item from the heap"""
+        index = self.positions.pop(item)
+        lastItem, lastPriority = self.items.pop(), self.priorities.pop()
+
+        # The removed item was the last one, nothing has to move
+        if index == len(self.items):
+            return
+
+        # Fill the hole with the last item, which may belong either above or below it
+        self._place(index, lastItem, lastPriority)
+        if index > 0 and lastPriority < self.priorities[(index - 1) // self.arity]:
+            self._siftUp(index)
+        else:
+            self._siftDown(index)
@@ -0,0 +1,176 @@
+"""
+    An indexed linked list (square root decomposition, also known as an unrolled linked list).
+    Instead of one node per element, the elements are kept in a sequence of blocks of roughly sqrt(n) elements each.
+    A positional operation first skips whole blocks, which takes O(sqrt(n)) steps since there are about sqrt(n) of them,
+    and then works inside a single block of O(sqrt(n)) elements.
+    Blocks that grow past twice the target size are split in half and blocks that shrink below half of it are merged
+    with their neighbour, so the sizes stay balanced no matter where the edits happen.
+
+    Time Complexity: - Get:            O(sqrt(n)) (square root)
+                     - insertHead:     O(sqrt(n)) (square root)
+                     - insertBetween:  O(sqrt(n)) (square root)
+                     - insertTail:     O(1)       (constant) {Amortized}
+                     - remove:         O(sqrt(n)) (square root)
+                     - popTail:        O(1)       (constant) {Amortized}
+                     - getValues:      O(n)       (linear)
+
+    Space Complexity: - All Cases:     O(n)       (linear)
+"""
+
+from math import isqrt
+
+# Blocks never target fewer elements than this, so small lists don't end up with many tiny blocks
+MIN_BLOCK_SIZE = 32
+
+
+class IndexedLinkedList:
+    def __init__(self):
+        """Instantiate a empty indexed linked list"""
+        self.blocks = []
+        self.length = 0
+
+    @classmethod
+    def fromIterable(cls, iterable):
+        """Build an indexed linked list holding the values of iterable, in order"""
+        linkedList = cls()
+        linkedList.extend(iterable)
+        return linkedList
+
+    def __len__(self) -> int:
+        """Returns the length of the linked list"""
+        return self.length
+
+    def _blockSize(self) -> int:
+        """The target number of elements per block"""
+        return max(MIN_BLOCK_SIZE, isqrt(self.length))
+
+    def _locate(self, i: int) -> tuple:
+        """Returns the index of the block holding the i'th element and the element's offset in it"""
+        for blockIndex, block in enumerate(self.blocks):
+            if i < len(block):
+                return blockIndex, i
+            i -= len(block)
+
+        # One past the last element, which is where the tail insertions go
+        return len(self.blocks) - 1, len(self.blocks[-1])
+
+    def _insert(self, i: int, value):
+        """Insert value so that it ends up at index i, for 0 <= i <= length"""
+        if not self.blocks:
+            self.blocks.append([value])
+            self.length += 1
+            return
+
+        blockIndex, offset = self._locate(i)
+        block = self.blocks[blockIndex]
+        block.insert(offset, value)
+        self.length += 1
+
+        # The block got too big, split it in half
+        size = self._blockSize()
+        if len(block) > 2 * size:
+            half = len(block) // 2
+            self.blocks.insert(blockIndex + 1, block[half:])
+            del block[half:]
+
+    def _remove(self, i: int):
+        """Remove and return the value at index i, for 0 <= i < length"""
+        blockIndex, offset = self._locate(i)
+        block = self.blocks[blockIndex]
+        value = block.pop(offset)
+        self.length -= 1
+
+        # The block got too small, merge the next block into it
+        size = self._blockSize()
+        if len(block) < size // 2 and blockIndex + 1 < len(self.blocks):
+            block.extend(self.blocks.pop(blockIndex + 1))
+
+            # The merged block may in turn be too big, split it in half
+            if len(block) > 2 * size:
+                half = len(block) // 2
+                self.blocks.insert(blockIndex + 1, block[half:])
+                del block[half:]
+
+        # Never keep empty blocks around
+        if not block:
+            del self.blocks[blockIndex]
+
+        return value
+
+    def get(self, i: int):
+        """Returns a value at index i if exists or None"""
+        # Out of bounds
+        if i < 0 or i >= self.length:
+            return None
+
+        blockIndex, offset = self._locate(i)
+        return self.blocks[blockIndex][offset]
+
+    def insertHead(self, value):
+        """Insert at the beginning of the linked list"""
+        self._insert(0, value)
+
+    def insertBetween(self, i: int, value):
+        """Insert between the elements of the linked list, the value ends up at index i"""
+        # Out of bounds
+        if i < 0 or i >= self.length:
+            return None
+
+        self._insert(i, value)
+
+    def insertTail(self, value):
+        """Inserts at the tail of the linked list"""
+        # Skip the block walk, the tail is always at the end of the last block
+        if self.blocks and len(self.blocks[-1]) < 2 * self._blockSize():
+            self.blocks[-1].append(value)
+        # The last block is full, start a new one
+        else:
+            self.blocks.append([value])
+        self.length += 1
+
+    def extend(self, iterable):
+        """Inserts all the values of iterable at the tail, cutting them into whole blocks at once"""
+        values = list(iterable)
+        self.length += len(values)
+        size = self._blockSize()
+
+        # Top up the last block first, then append full blocks
+        start = 0
+        if self.blocks:
+            start = max(0, 2 * size - len(self.blocks[-1]))
+            self.blocks[-1].extend(values[:start])
+
+        for low in range(start, len(values), size):
+            self.blocks.append(values[low : low + size])
+
+    def remove(self, i: int):
+        """Removes the element at index i if exists else None"""
+        # Out of bounds
+        if i < 0 or i >= self.length:
+            return None
+
+        return self._remove(i)
+
+    def popTail(self):
+        """Removes the last element if exists else None"""
+        if self.length == 0:
+            return None
+
+        # Skip the block walk, the tail is always at the end of the last block
+        block = self.blocks[-1]
+        value = block.pop()
+        self.length -= 1
+
+        if not block:
+            self.blocks.pop()
+
+        return value
+
+    def getValues(self) -> list:
+        """Returns the contents of the linked list in array"""
+        result = []
+
+        for block in self.blocks:
+            result.extend(block)
+
+        return result
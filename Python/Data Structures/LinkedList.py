@@ -21,6 +21,9 @@
 
 
 class Node:
+    # No per-instance __dict__, a node only ever has these two attributes
+    __slots__ = ("value", "next")
+
     def __init__(self, value):
         """Instantiates a new linked list node with value"""
         self.value = value
@@ -33,6 +36,13 @@ class LinkedList:
         self.head = self.tail = None
         self.length = 0
 
+    @classmethod
+    def fromIterable(cls, iterable):
+        """Build a linked list holding the values of iterable, in order"""
+        linkedList = cls()
+        linkedList.extend(iterable)
+        return linkedList
+
     def __len__(self) -> int:
         """Returns the length of the linked list"""
         return self.length
@@ -67,11 +77,15 @@ class LinkedList:
         self.length += 1
 
     def insertBetween(self, i: int, value):
-        """Insert between the elements of the linked list"""
+        """Insert between the elements of the linked list, the value ends up at index i"""
         # Out of bounds
         if i < 0 or i >= self.length:
             return None
 
+        # Special case of insertion at head, there is no element before it
+        if i == 0:
+            return self.insertHead(value)
+
         node = Node(value)
         currentNode = self.head
         idx = 0
@@ -81,6 +95,7 @@ class LinkedList:
 
         node.next = currentNode.next
         currentNode.next = node
+        self.length += 1
 
     def insertTail(self, value):
         """Inserts at the tail of the linked list"""
@@ -94,6 +109,28 @@ class LinkedList:
             self.tail = node
         self.length += 1
 
+    def extend(self, iterable):
+        """Inserts all the values of iterable at the tail, building the chain first and splicing it in once"""
+        # A placeholder node in front of the chain, so linking the first value isn't a special case
+        start = chainTail = Node(None)
+        count = 0
+
+        for value in iterable:
+            chainTail.next = Node(value)
+            chainTail = chainTail.next
+            count += 1
+
+        # Nothing to splice
+        if count == 0:
+            return
+
+        if self.tail is None:
+            self.head = start.next
+        else:
+            self.tail.next = start.next
+        self.tail = chainTail
+        self.length += count
+
     def remove(self, i: int):
         """Removes the element at index i if exists else None"""
         # Out of bounds
@@ -103,11 +140,11 @@ class LinkedList:
         # Special case of removal at head
         if i == 0:
             node = self.head
+            self.head = node.next
 
-            if node:
-                self.head = node.next
-            else:
-                self.head = self.tail = None
+            # Removed the only element
+            if self.head is None:
+                self.tail = None
 
             self.length -= 1
             return node.value
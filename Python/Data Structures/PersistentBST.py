@@ -0,0 +1,255 @@
+"""
+    A persistent binary search tree. Nodes are never modified once they are created and have no parent pointers,
+    so instead of relinking nodes in place, insert and delete copy the nodes on the path from the root to the change
+    (path copying) and return a new root. Every other subtree is shared between the old and the new version.
+
+    Every old root stays a complete, valid tree, so taking a snapshot of the tree is just keeping a reference to the
+    current root, in O(1). Readers can traverse a snapshot without any locking while writers keep building newer versions,
+    and writers publish a new version with a single assignment to `root`. Writers are still serialized among themselves,
+    so two concurrent writes can't lose one another's change.
+
+    Like `BST` the tree isn't rebalanced, so its height depends on the insertion order.
+
+    Time Complexity: - Worst Case {Degenerate Tree}:
+                         - Search:   O(n)      (linear)
+                         - Insert:   O(n)      (linear)
+                         - Delete:   O(n)      (linear)
+                         - Snapshot: O(1)      (constant)
+
+                     - Average Case {Non-Degenerate Tree}:
+                         - Search:   O(log(n)) (logarithmic)
+                         - Insert:   O(log(n)) (logarithmic)
+                         - Delete:   O(log(n)) (logarithmic)
+                         - Snapshot: O(1)      (constant)
+
+    Space Complexity: - All Cases:   O(n)      (linear) {Plus O(h) new nodes per insert or delete, shared versions are kept alive by their readers}
+"""
+
+from threading import Lock
+
+
+class PersistentNode:
+    # No per-instance __dict__, and the attributes are never changed after __init__
+    __slots__ = ("value", "key", "left", "right", "size")
+
+    def __init__(self, value, key, left=None, right=None):
+        self.value = value
+        self.key = key
+        self.left = left
+        self.right = right
+        # Number of nodes in the subtree rooted at this node
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+
+
+class PersistentBST:
+    def __init__(self, key=None, root: PersistentNode = None):
+        """
+        Instantiate a tree, empty unless it's given the root of an existing version.
+        The nodes are ordered by key(value) if a `key` function is given, else by their values.
+        """
+        self.root = root
+        self.keyFunction = key
+        # Serializes the writers, readers never take it
+        self._writeLock = Lock()
+
+    @classmethod
+    def fromSorted(cls, iterable, key=None):
+        """
+        Build a perfectly balanced tree from values that are already in sorted order (by `key`, if given), in O(n).
+        """
+        tree = cls(key)
+        values = list(iterable)
+
+        def build(low: int, high: int) -> PersistentNode:
+            # Empty range
+            if low >= high:
+                return None
+
+            # The middle value is the root, the halves on either side are its subtrees
+            middle = (low + high) // 2
+            return PersistentNode(values[middle], tree._keyOf(values[middle]), build(low, middle), build(middle + 1, high))
+
+        tree.root = build(0, len(values))
+        return tree
+
+    def _keyOf(self, value):
+        """The key the tree orders value by"""
+        return value if self.keyFunction is None else self.keyFunction(value)
+
+    def snapshot(self):
+        """
+        Returns a tree holding the current version, in O(1).
+        Later inserts and deletes on either tree don't affect the other one.
+        """
+        return PersistentBST(self.keyFunction, self.root)
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the tree"""
+        root = self.root
+        return root.size if root else 0
+
+    def __contains__(self, key) -> bool:
+        """Whether a node with the key `key` is in the tree"""
+        return self.find(key) is not None
+
+    def find(self, key) -> PersistentNode:
+        """
+        Search for a node with the key `key` (its value, unless the tree has a key function).
+        """
+        # Read the root once, a writer may publish a new version while the search runs
+        currentNode = self.root
+
+        while currentNode:
+            # Found the node
+            if key == currentNode.key:
+                return currentNode
+            # Node is in the left subtree
+            elif key <= currentNode.key:
+                currentNode = currentNode.left
+            # Node is in the right subtree
+            else:
+                currentNode = currentNode.right
+
+        # Node not found
+        return None
+
+    def rank(self, key) -> int:
+        """
+        The number of nodes whose key is less than `key`.
+        """
+        currentNode = self.root
+        rank = 0
+
+        while currentNode:
+            # The node and its left subtree are smaller, count them and go right
+            if currentNode.key < key:
+                rank += (currentNode.left.size if currentNode.left else 0) + 1
+                currentNode = currentNode.right
+            else:
+                currentNode = currentNode.left
+
+        return rank
+
+    def select(self, k: int) -> PersistentNode:
+        """
+        Find the node with the k-th smallest key (counting from 0, negative k counts from the largest like list indices).
+        """
+        currentNode = self.root
+        length = currentNode.size if currentNode else 0
+        if k < 0:
+            k += length
+        if not 0 <= k < length:
+            raise IndexError("select index out of range")
+
+        while True:
+            leftSize = currentNode.left.size if currentNode.left else 0
+
+            # The k-th key is in the left subtree
+            if k < leftSize:
+                currentNode = currentNode.left
+            # The node itself is the k-th key
+            elif k == leftSize:
+                return currentNode
+            # Skip the left subtree and the node, look for the rest in the right subtree
+            else:
+                k -= leftSize + 1
+                currentNode = currentNode.right
+
+    def _rebuild(self, path: list, subtree: PersistentNode) -> PersistentNode:
+        """
+        Copy the nodes on path, a list of (node, wentLeft) pairs from the root down, bottom-up with subtree in place of
+        the child the path went to, and return the new root. The subtrees off the path are shared, not copied.
+        """
+        for node, wentLeft in reversed(path):
+            if wentLeft:
+                subtree = PersistentNode(node.value, node.key, subtree, node.right)
+            else:
+                subtree = PersistentNode(node.value, node.key, node.left, subtree)
+
+        return subtree
+
+    def insert(self, value) -> PersistentNode:
+        """
+        Insert a node with the value `value` and return the root of the new version.
+        """
+        key = self._keyOf(value)
+
+        with self._writeLock:
+            path = []
+            currentNode = self.root
+
+            # Find the empty spot the new node goes in, remembering the way down
+            while currentNode:
+                wentLeft = key <= currentNode.key
+                path.append((currentNode, wentLeft))
+                currentNode = currentNode.left if wentLeft else currentNode.right
+
+            # Publish the new version with a single assignment
+            self.root = self._rebuild(path, PersistentNode(value, key))
+            return self.root
+
+    def delete(self, key) -> PersistentNode:
+        """
+        Delete a node with the key `key` and return it, None if there's no such node.
+        Older versions still hold the node.
+        """
+        with self._writeLock:
+            path = []
+            currentNode = self.root
+
+            while currentNode and key != currentNode.key:
+                wentLeft = key <= currentNode.key
+                path.append((currentNode, wentLeft))
+                currentNode = currentNode.left if wentLeft else currentNode.right
+
+            # There's no node with key `key`
+            if currentNode is None:
+                return None
+
+            # At most one child, it takes the node's place
+            if currentNode.left is None:
+                replacement = currentNode.right
+            elif currentNode.right is None:
+                replacement = currentNode.left
+            # Two children, the successor takes the node's place
+            else:
+                successorPath = []
+                successor = currentNode.right
+                while successor.left:
+                    successorPath.append((successor, True))
+                    successor = successor.left
+
+                # The right subtree without its minimum, the successor's right child moves up into its place
+                right = self._rebuild(successorPath, successor.right)
+                replacement = PersistentNode(successor.value, successor.key, currentNode.left, right)
+
+            self.root = self._rebuild(path, replacement)
+            return currentNode
+
+    def __iter__(self):
+        """Lazily yield the values of the current version in sorted order"""
+        return self.inOrderIter(self.root)
+
+    def inOrderIter(self, node: PersistentNode):
+        """
+        Lazily perform an inOrder traversal of the subtree rooted at node, using an explicit stack instead of recursion.
+        The nodes never change, so this is safe while the tree is being written to.
+        """
+        stack = []
+        currentNode = node
+
+        while stack or currentNode:
+            # Go as far left as possible, remembering the way back
+            while currentNode:
+                stack.append(currentNode)
+                currentNode = currentNode.left
+
+            currentNode = stack.pop()
+            yield currentNode.value
+            currentNode = currentNode.right
+
+    def inOrderTraversal(self, node: PersistentNode) -> list:
+        """
+        Perform an inOrder traversal of a binary tree and return a list containing it.
+        """
+        return list(self.inOrderIter(node))
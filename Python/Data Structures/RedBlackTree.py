@@ -0,0 +1,225 @@
+"""
+    In computer science, a red–black tree is a kind of self-balancing binary search tree.
+    Each node stores an extra bit representing "color" ("red" or "black"), used to ensure that the tree remains balanced during insertions and deletions.
+    The tree obeys the following rules:
+        - Every node is either red or black, the root and the (empty) leaves are black.
+        - A red node does not have a red child.
+        - Every path from a given node to any of its descendant leaves goes through the same number of black nodes.
+    Together these guarantee that the longest path from the root is no more than twice as long as the shortest one,
+    and restoring them after an insertion or deletion takes at most three rotations.
+
+    Time Complexity: - All Cases:
+                         - Search: O(log(n)) (logarithmic)
+                         - Insert: O(log(n)) (logarithmic)
+                         - Delete: O(log(n)) (logarithmic)
+                         - Rank:   O(log(n)) (logarithmic) {Also select and countRange}
+
+    Space Complexity: - All Cases: O(n)      (linear)
+"""
+
+from BinarySearchTree import BST, Node
+
+RED = True
+BLACK = False
+
+
+class RBNode(Node):
+    __slots__ = ("color",)
+
+    def __init__(self, value):
+        super().__init__(value)
+        # A new node is always inserted red
+        self.color = RED
+
+
+def _color(node: RBNode) -> bool:
+    """The empty leaves are black"""
+    return BLACK if node is None else node.color
+
+
+class RedBlackTree(BST):
+    nodeClass = RBNode
+
+    def _link(self, nodes: list) -> RBNode:
+        root = super()._link(nodes)
+
+        # A perfectly balanced tree has all of its leaves on the last two levels.
+        # Coloring everything black except an incomplete last level keeps the black height equal on every path.
+        lastLevel = len(nodes).bit_length() - 1
+        incomplete = len(nodes) != (1 << (lastLevel + 1)) - 1
+
+        level, depth = [root] if root else [], 0
+        while level:
+            nextLevel = []
+            for node in level:
+                node.color = RED if incomplete and depth == lastLevel else BLACK
+                if node.left:
+                    nextLevel.append(node.left)
+                if node.right:
+                    nextLevel.append(node.right)
+            level, depth = nextLevel, depth + 1
+
+        return root
+
+    def insert(self, node: RBNode) -> RBNode:
+        """
+        Inserts a node in the tree with the value `value` and return the inserted node.
+        """
+        inserted = node
+        node.color = RED
+        super().insert(node)
+
+        # Fix red-red violations going up the tree
+        while node.parent is not None and node.parent.color == RED:
+            parent = node.parent
+            # The parent is red, so it isn't the root and the grandparent exists
+            grandparent = parent.parent
+
+            if parent == grandparent.left:
+                uncle = grandparent.right
+
+                # Red uncle, push the blackness down from the grandparent and continue from there
+                if _color(uncle) == RED:
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                else:
+                    # Node is an inner child, rotate it to the outside
+                    if node == parent.right:
+                        node = parent
+                        self._rotateLeft(node)
+                        parent = node.parent
+
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    self._rotateRight(grandparent)
+            else:
+                uncle = grandparent.left
+
+                # Red uncle, push the blackness down from the grandparent and continue from there
+                if _color(uncle) == RED:
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                else:
+                    # Node is an inner child, rotate it to the outside
+                    if node == parent.left:
+                        node = parent
+                        self._rotateRight(node)
+                        parent = node.parent
+
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    self._rotateLeft(grandparent)
+
+        self.root.color = BLACK
+
+        # The rotations changed the heights of the nodes above them, which are all on the insertion path
+        self._updatePath(inserted.parent)
+        return inserted
+
+    def _deleteNode(self, currentNode: RBNode) -> RBNode:
+        # Color of the node that actually leaves its position in the tree
+        removedColor = currentNode.color
+
+        if currentNode.left is None:
+            child, parent = currentNode.right, currentNode.parent
+            self._shiftNodes(currentNode, currentNode.right)
+        elif currentNode.right is None:
+            child, parent = currentNode.left, currentNode.parent
+            self._shiftNodes(currentNode, currentNode.left)
+        else:
+            # The successor moves into currentNode's place and takes its color
+            successor = self.minimum(currentNode.right)
+            removedColor = successor.color
+            child = successor.right
+
+            if successor.parent == currentNode:
+                parent = successor
+            else:
+                parent = successor.parent
+                self._shiftNodes(successor, successor.right)
+                successor.right = currentNode.right
+                successor.right.parent = successor
+
+            self._shiftNodes(currentNode, successor)
+            successor.left = currentNode.left
+            successor.left.parent = successor
+            successor.color = currentNode.color
+
+        self._detach(currentNode)
+
+        # The sizes and heights have to be right before the fixup, its rotations recompute them from the children
+        self._updatePath(parent)
+
+        # Removing a red node can't break any of the rules
+        if removedColor == BLACK:
+            self._deleteFixup(child, parent)
+            # The rotations changed the heights of the nodes above them, which are all above parent
+            self._updatePath(parent)
+
+        return parent
+
+    def _deleteFixup(self, node: RBNode, parent: RBNode):
+        """
+        A black node was removed above `node`, which is now one black short.
+        `parent` is tracked separately since `node` may be an empty leaf.
+        """
+        while node != self.root and _color(node) == BLACK:
+            if node == parent.left:
+                sibling = parent.right
+
+                # Red sibling, rotate so the sibling becomes black
+                if _color(sibling) == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self._rotateLeft(parent)
+                    sibling = parent.right
+
+                # Both of the sibling's children are black, move the problem up
+                if _color(sibling.left) == BLACK and _color(sibling.right) == BLACK:
+                    sibling.color = RED
+                    node, parent = parent, parent.parent
+                else:
+                    # Rotate so the sibling's outer child is the red one
+                    if _color(sibling.right) == BLACK:
+                        sibling.left.color = BLACK
+                        sibling.color = RED
+                        self._rotateRight(sibling)
+                        sibling = parent.right
+
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.right.color = BLACK
+                    self._rotateLeft(parent)
+                    node = self.root
+            else:
+                sibling = parent.left
+
+                # Red sibling, rotate so the sibling becomes black
+                if _color(sibling) == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self._rotateRight(parent)
+                    sibling = parent.left
+
+                # Both of the sibling's children are black, move the problem up
+                if _color(sibling.left) == BLACK and _color(sibling.right) == BLACK:
+                    sibling.color = RED
+                    node, parent = parent, parent.parent
+                else:
+                    # Rotate so the sibling's outer child is the red one
+                    if _color(sibling.left) == BLACK:
+                        sibling.right.color = BLACK
+                        sibling.color = RED
+                        self._rotateLeft(sibling)
+                        sibling = parent.left
+
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.left.color = BLACK
+                    self._rotateRight(parent)
+                    node = self.root
+
+        if node is not None:
+            node.color = BLACK